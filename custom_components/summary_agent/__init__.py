@@ -2,13 +2,41 @@
 
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import (
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.typing import ConfigType
 
 # from homeassistant.exceptions import ConfigEntryError
 
-from .const import DOMAIN
+from .agent_pool import AgentPool, LoadBalancingStrategy
+from .const import (
+    DOMAIN,
+    CONF_AGENT_ID,
+    CONF_AGENT_POOL,
+    CONF_HISTORY_SIZE,
+    CONF_LOAD_BALANCING,
+    DEFAULT_LOAD_BALANCING,
+)
+from .engine import DATA_ENGINE, SummaryEngine
+from .history import SummaryHistory, async_remove_history
+from .models import SummaryAgentData
+from .replay import ATTR_CAPTURES, ATTR_RERENDER, CAPTURE_SCHEMA, async_replay
+from . import websocket_api
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -17,16 +45,134 @@ PLATFORMS: list[Platform] = [
     Platform.SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SERVICE_REPLAY = "replay"
+REPLAY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_AGENT_ID): cv.entity_id,
+        vol.Required(ATTR_CAPTURES): vol.All(cv.ensure_list, [CAPTURE_SCHEMA]),
+        vol.Optional(ATTR_RERENDER, default=False): cv.boolean,
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Summary Agent services."""
+    engine = SummaryEngine(hass)
+    stop_engine = engine.async_start()
+    hass.data[DATA_ENGINE] = engine
+
+    @callback
+    def async_stop_engine(event: Event) -> None:
+        """Stop listening for changes when Home Assistant stops."""
+        stop_engine()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_engine)
+    websocket_api.async_setup(hass)
+
+    async def async_replay_service(call: ServiceCall) -> ServiceResponse:
+        """Replay captured prompts against a stand-in conversation agent."""
+        data: dict[str, SummaryAgentData] = hass.data.get(DOMAIN, {})
+        return await async_replay(
+            hass,
+            [agent for entry_data in data.values() for agent in entry_data.agents],
+            call.data[ATTR_CAPTURES],
+            call.data[CONF_AGENT_ID],
+            call.data[ATTR_RERENDER],
+            call.context,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY,
+        async_replay_service,
+        schema=REPLAY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     hass.data.setdefault(DOMAIN, {})
+    agent_ids = [entry.options[CONF_AGENT_ID]]
+    agent_ids.extend(
+        agent_id
+        for agent_id in entry.options.get(CONF_AGENT_POOL, [])
+        if agent_id not in agent_ids
+    )
+    pool = AgentPool(
+        agent_ids,
+        LoadBalancingStrategy(
+            entry.options.get(CONF_LOAD_BALANCING, DEFAULT_LOAD_BALANCING)
+        ),
+    )
+    history: SummaryHistory | None = None
+    if history_size := int(entry.options.get(CONF_HISTORY_SIZE, 0)):
+        history = SummaryHistory(hass, entry.entry_id, history_size)
+        await history.async_load()
+    hass.data[DOMAIN][entry.entry_id] = SummaryAgentData(pool=pool, history=history)
+    # Each backing agent can work on one summary refresh at a time
+    entry.async_on_unload(
+        hass.data[DATA_ENGINE].async_add_entry(entry.entry_id, len(pool.agent_ids))
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate the unique ids of entities to be scoped to the config entry."""
+    if entry.version > 1:
+        return False
+    if entry.minor_version < 2:
+        prefix = f"{entry.entry_id}-"
+
+        @callback
+        def migrate_unique_id(entity_entry: er.RegistryEntry) -> dict[str, str] | None:
+            if entity_entry.unique_id.startswith(prefix):
+                return None
+            return {"new_unique_id": f"{prefix}{entity_entry.unique_id}"}
+
+        await er.async_migrate_entries(hass, entry.entry_id, migrate_unique_id)
+
+        device_registry = dr.async_get(hass)
+        for device in dr.async_entries_for_config_entry(
+            device_registry, entry.entry_id
+        ):
+            identifiers = {
+                (
+                    (domain, f"{prefix}{identifier}")
+                    if domain == DOMAIN and not identifier.startswith(prefix)
+                    else (domain, identifier)
+                )
+                for domain, identifier in device.identifiers
+            }
+            if identifiers != device.identifiers:
+                device_registry.async_update_device(
+                    device.id, new_identifiers=identifiers
+                )
+
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+        _LOGGER.debug("Migrated %s to version 1.2", entry.entry_id)
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        hass.data[DOMAIN].pop(entry.entry_id)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored summary history of the entry."""
+    await async_remove_history(hass, entry.entry_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload config entry when the options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,192 @@
+"""Load balancing of summary requests across backing conversation agents.
+
+Each agent has a circuit breaker. After repeated failures the circuit opens and
+the agent is not sent requests until a backoff delay has passed. A single probe
+request is then allowed through, closing the circuit on success or opening it
+again with a longer delay on failure.
+"""
+
+from dataclasses import dataclass
+import datetime
+from enum import StrEnum
+import itertools
+import logging
+import random
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Consecutive failures before the circuit of an agent is opened
+CIRCUIT_FAILURES = 3
+# Delay before the first probe of an agent, doubled each time a probe fails
+BACKOFF_INITIAL = datetime.timedelta(minutes=1)
+BACKOFF_MAX = datetime.timedelta(minutes=30)
+# Fraction of the backoff delay randomized so probes are spread out
+BACKOFF_JITTER = 0.2
+# Weight of the most recent request in the latency moving average
+LATENCY_ALPHA = 0.3
+
+
+class CircuitState(StrEnum):
+    """State of the circuit breaker of a backing agent."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class LoadBalancingStrategy(StrEnum):
+    """Strategy for selecting a backing agent from the pool."""
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_OUTSTANDING = "least_outstanding"
+    LOWEST_LATENCY = "lowest_latency"
+
+
+@dataclass
+class AgentStats:
+    """Health and latency of a backing agent."""
+
+    agent_id: str
+    outstanding: int = 0
+    requests: int = 0
+    errors: int = 0
+    consecutive_failures: int = 0
+    latency: float | None = None
+    state: CircuitState = CircuitState.CLOSED
+    trips: int = 0
+    retry_at: datetime.datetime | None = None
+
+    def available(self, now: datetime.datetime) -> bool:
+        """Return True if the agent may be sent a request."""
+        if self.state == CircuitState.OPEN:
+            return self.retry_at is None or now >= self.retry_at
+        if self.state == CircuitState.HALF_OPEN:
+            # Only a single probe is sent until the agent has recovered
+            return self.outstanding == 0
+        return True
+
+    def trip(self, now: datetime.datetime) -> None:
+        """Open the circuit with an exponential backoff before the next probe."""
+        self.trips += 1
+        backoff = min(
+            BACKOFF_INITIAL * 2 ** (self.trips - 1),
+            BACKOFF_MAX,
+        )
+        self.state = CircuitState.OPEN
+        self.retry_at = now + backoff * random.uniform(
+            1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the stats."""
+        return {
+            "agent_id": self.agent_id,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "errors": self.errors,
+            "consecutive_failures": self.consecutive_failures,
+            "latency": self.latency,
+            "healthy": self.state == CircuitState.CLOSED,
+            "state": str(self.state),
+            "trips": self.trips,
+            "retry_at": self.retry_at.isoformat() if self.retry_at else None,
+        }
+
+
+class AgentPool:
+    """A pool of backing conversation agents."""
+
+    def __init__(self, agent_ids: list[str], strategy: LoadBalancingStrategy) -> None:
+        """Initialize AgentPool."""
+        self._stats = {agent_id: AgentStats(agent_id) for agent_id in agent_ids}
+        self._strategy = strategy
+        self._round_robin = itertools.cycle(self._stats)
+
+    @property
+    def agent_ids(self) -> list[str]:
+        """Return the agents in the pool."""
+        return list(self._stats)
+
+    def async_available(self) -> bool:
+        """Return True if any agent in the pool may be sent a request."""
+        now = dt_util.utcnow()
+        return any(stats.available(now) for stats in self._stats.values())
+
+    def async_select(self) -> str | None:
+        """Return the agent to send the next request to.
+
+        Returns None when the circuit of every agent is open.
+        """
+        now = dt_util.utcnow()
+        candidates = [stats for stats in self._stats.values() if stats.available(now)]
+        if not candidates:
+            return None
+        # Agents that are ready to be probed are preferred so they can recover
+        if probes := [
+            stats for stats in candidates if stats.state != CircuitState.CLOSED
+        ]:
+            return probes[0].agent_id
+        if len(candidates) == 1:
+            return candidates[0].agent_id
+        if self._strategy == LoadBalancingStrategy.LEAST_OUTSTANDING:
+            return min(candidates, key=lambda stats: stats.outstanding).agent_id
+        if self._strategy == LoadBalancingStrategy.LOWEST_LATENCY:
+            # Agents without a latency measurement are tried first
+            return min(
+                candidates,
+                key=lambda stats: (stats.latency is not None, stats.latency or 0.0),
+            ).agent_id
+        available = {stats.agent_id for stats in candidates}
+        return next(agent_id for agent_id in self._round_robin if agent_id in available)
+
+    def async_request_started(self, agent_id: str) -> None:
+        """Record the start of a request to an agent in the pool."""
+        if (stats := self._stats.get(agent_id)) is None:
+            return
+        if stats.state == CircuitState.OPEN:
+            _LOGGER.debug("Probing agent %s", agent_id)
+            stats.state = CircuitState.HALF_OPEN
+        stats.outstanding += 1
+        stats.requests += 1
+
+    def async_request_finished(
+        self, agent_id: str, duration: float, success: bool
+    ) -> None:
+        """Record the result of a request and update the health of the agent."""
+        if (stats := self._stats.get(agent_id)) is None:
+            return
+        stats.outstanding -= 1
+        if success:
+            stats.latency = (
+                duration
+                if stats.latency is None
+                else LATENCY_ALPHA * duration + (1 - LATENCY_ALPHA) * stats.latency
+            )
+            stats.consecutive_failures = 0
+            if stats.state != CircuitState.CLOSED:
+                _LOGGER.info("Agent %s recovered, closing circuit", agent_id)
+            stats.state = CircuitState.CLOSED
+            stats.trips = 0
+            stats.retry_at = None
+            return
+        stats.errors += 1
+        stats.consecutive_failures += 1
+        if stats.state == CircuitState.OPEN:
+            return
+        if (
+            stats.state == CircuitState.HALF_OPEN
+            or stats.consecutive_failures >= CIRCUIT_FAILURES
+        ):
+            if stats.state == CircuitState.CLOSED:
+                _LOGGER.warning("Opening circuit for failing agent %s", agent_id)
+            stats.trip(dt_util.utcnow())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the pool."""
+        return {
+            "strategy": str(self._strategy),
+            "agents": [stats.as_dict() for stats in self._stats.values()],
+        }
@@ -0,0 +1,102 @@
+"""Index of the areas affected by a change to an entity.
+
+The index is built lazily from the entity and device registries and is cleared
+whenever one of the registries changes, so a state change is resolved to its
+areas with a dictionary lookup instead of a registry walk for every listener.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import DOMAIN
+
+type AreaListener = Callable[[Event[EventStateChangedData]], None]
+
+
+@dataclass(frozen=True)
+class EntityAreas:
+    """The device of an entity and the areas it is shown in."""
+
+    device_id: str | None
+    area_ids: frozenset[str]
+
+
+NO_AREAS = EntityAreas(None, frozenset())
+
+
+class AreaIndex:
+    """Resolves entities to their device and areas and dispatches changes."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize AreaIndex."""
+        self._hass = hass
+        self._entities: dict[str, EntityAreas] = {}
+        self._listeners: dict[str, list[AreaListener]] = {}
+
+    @callback
+    def async_get(self, entity_id: str) -> EntityAreas:
+        """Return the device and areas of an entity.
+
+        An entity is in the area it is assigned to, or the area of its device
+        when it has none. It is also in the area of its device, where it is
+        shown in the area prompt. Entities of this integration are not in any
+        area so summaries do not respond to their own updates.
+        """
+        if (areas := self._entities.get(entity_id)) is not None:
+            return areas
+        areas = NO_AREAS
+        entity_registry = er.async_get(self._hass)
+        entry = entity_registry.async_get(entity_id)
+        if entry is not None and entry.platform != DOMAIN:
+            device_area_id = None
+            if entry.device_id is not None:
+                device_registry = dr.async_get(self._hass)
+                if device := device_registry.async_get(entry.device_id):
+                    device_area_id = device.area_id
+            areas = EntityAreas(
+                entry.device_id,
+                frozenset(
+                    area_id
+                    for area_id in (entry.area_id, device_area_id)
+                    if area_id is not None
+                ),
+            )
+        self._entities[entity_id] = areas
+        return areas
+
+    @callback
+    def async_clear(self) -> None:
+        """Discard the index after a registry change."""
+        self._entities.clear()
+
+    @callback
+    def async_listen(self, area_id: str, listener: AreaListener) -> CALLBACK_TYPE:
+        """Listen for state changes of entities in an area."""
+        listeners = self._listeners.setdefault(area_id, [])
+        listeners.append(listener)
+
+        @callback
+        def async_remove() -> None:
+            listeners.remove(listener)
+            if not listeners:
+                del self._listeners[area_id]
+
+        return async_remove
+
+    @callback
+    def async_dispatch(
+        self, areas: EntityAreas, event: Event[EventStateChangedData]
+    ) -> None:
+        """Call the listeners of the areas of a changed entity."""
+        for area_id in areas.area_ids:
+            for listener in list(self._listeners.get(area_id, ())):
+                listener(event)
@@ -0,0 +1,62 @@
+"""Capture of recent prompts and responses sent to the backing agent.
+
+Captures are kept in a bounded ring buffer per summary agent when enabled in
+the options. They are exported through diagnostics and may be replayed against
+another conversation agent to benchmark changes on a real workload.
+"""
+
+from collections import deque
+from dataclasses import dataclass, asdict
+import datetime
+from typing import Any
+
+
+@dataclass
+class PromptCapture:
+    """A prompt sent to the backing agent and its response."""
+
+    timestamp: datetime.datetime
+    """Time the prompt was sent to the backing agent."""
+
+    entity_id: str
+    """Summary agent that rendered the prompt."""
+
+    agent_id: str
+    """Backing agent that processed the prompt."""
+
+    input_text: str
+    """Text sent to the summary agent, such as the area name."""
+
+    prompt: str
+    """Prompt rendered by the summary agent."""
+
+    response: str | None
+    """Response from the backing agent or None if it failed."""
+
+    duration: float
+    """Time in seconds spent waiting on the backing agent."""
+
+    error: str | None = None
+    """Error from the backing agent, if any."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the capture."""
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+class PromptCaptureBuffer:
+    """A bounded ring buffer of recent prompt captures."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize PromptCaptureBuffer."""
+        self._captures: deque[PromptCapture] = deque(maxlen=size)
+
+    def async_record(self, capture: PromptCapture) -> None:
+        """Record a capture, evicting the oldest when the buffer is full."""
+        self._captures.append(capture)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the captures from oldest to newest."""
+        return [capture.as_dict() for capture in self._captures]
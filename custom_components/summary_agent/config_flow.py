@@ -8,14 +8,54 @@ from typing import Any
 from homeassistant import config_entries
 from homeassistant.helpers import selector, entity_registry as er
 from homeassistant.helpers.schema_config_entry_flow import (
+    SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
+    SchemaFlowError,
     SchemaFlowFormStep,
 )
 
-from .const import DOMAIN, CONF_AGENT_ID
+from .agent_pool import LoadBalancingStrategy
+from .custom_summary import CUSTOM_SUMMARIES_SCHEMA
+from .quantize import QUANTIZATION_SCHEMA
+from .significance import WEIGHTS_SCHEMA
+from .const import (
+    DOMAIN,
+    CONF_AGENT_ID,
+    CONF_AGENT_POOL,
+    CONF_LOAD_BALANCING,
+    CONF_QUANTIZATION,
+    CONF_LOCAL_FAST_PATH,
+    CONF_CAPTURE_SIZE,
+    CONF_HISTORY_SIZE,
+    CONF_CUSTOM_SUMMARIES,
+    CONF_SIGNIFICANCE_THRESHOLD,
+    CONF_SIGNIFICANCE_WEIGHTS,
+    CONF_MAX_AGE,
+    CONF_SIMILARITY_THRESHOLD,
+    CONF_LAZY,
+    CONF_LAZY_MAX_AGE,
+    CONF_WEATHER_ENTITY,
+    DEFAULT_QUANTIZATION,
+    DEFAULT_SIGNIFICANCE_THRESHOLD,
+    DEFAULT_SIGNIFICANCE_WEIGHTS,
+    DEFAULT_MAX_AGE,
+    DEFAULT_LAZY_MAX_AGE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+AGENT_POOL_SCHEMA: dict[vol.Marker, Any] = {
+    vol.Optional(CONF_AGENT_POOL): selector.EntitySelector(
+        selector.EntitySelectorConfig(domain="conversation", multiple=True),
+    ),
+    vol.Optional(CONF_LOAD_BALANCING): selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[strategy.value for strategy in LoadBalancingStrategy],
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    ),
+}
+
 CONFIG_FLOW = {
     "user": SchemaFlowFormStep(
         vol.Schema(
@@ -23,13 +63,100 @@ CONFIG_FLOW = {
                 vol.Required(CONF_AGENT_ID): selector.EntitySelector(
                     selector.EntitySelectorConfig(domain="conversation"),
                 ),
+                **AGENT_POOL_SCHEMA,
             }
         )
     )
 }
 
+
+async def validate_options(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate the options that are entered as objects."""
+    try:
+        QUANTIZATION_SCHEMA(user_input.get(CONF_QUANTIZATION, {}))
+    except vol.Invalid as err:
+        _LOGGER.debug("Invalid quantization: %s", err)
+        raise SchemaFlowError("invalid_quantization") from err
+    try:
+        WEIGHTS_SCHEMA(user_input.get(CONF_SIGNIFICANCE_WEIGHTS, {}))
+    except vol.Invalid as err:
+        _LOGGER.debug("Invalid significance weights: %s", err)
+        raise SchemaFlowError("invalid_significance_weights") from err
+    try:
+        CUSTOM_SUMMARIES_SCHEMA(user_input.get(CONF_CUSTOM_SUMMARIES, []))
+    except vol.Invalid as err:
+        _LOGGER.debug("Invalid custom summaries: %s", err)
+        raise SchemaFlowError("invalid_custom_summaries") from err
+    return user_input
+
+
 OPTIONS_FLOW = {
-    "init": SchemaFlowFormStep(),
+    "init": SchemaFlowFormStep(
+        vol.Schema(
+            {
+                **AGENT_POOL_SCHEMA,
+                vol.Optional(
+                    CONF_QUANTIZATION, default=DEFAULT_QUANTIZATION
+                ): selector.ObjectSelector(),
+                vol.Optional(
+                    CONF_LOCAL_FAST_PATH, default=False
+                ): selector.BooleanSelector(),
+                vol.Optional(CONF_CAPTURE_SIZE, default=0): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1000, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(CONF_HISTORY_SIZE, default=0): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1000, mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    CONF_SIGNIFICANCE_THRESHOLD, default=DEFAULT_SIGNIFICANCE_THRESHOLD
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, step="any", mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(
+                    CONF_SIGNIFICANCE_WEIGHTS, default=DEFAULT_SIGNIFICANCE_WEIGHTS
+                ): selector.ObjectSelector(),
+                vol.Optional(
+                    CONF_MAX_AGE, default=DEFAULT_MAX_AGE
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        unit_of_measurement="minutes",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(CONF_SIMILARITY_THRESHOLD): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=1, step="any", mode=selector.NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Optional(CONF_LAZY, default=False): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_LAZY_MAX_AGE, default=DEFAULT_LAZY_MAX_AGE
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        unit_of_measurement="minutes",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(CONF_WEATHER_ENTITY): selector.EntitySelector(
+                    selector.EntitySelectorConfig(domain="weather"),
+                ),
+                vol.Optional(
+                    CONF_CUSTOM_SUMMARIES, default=[]
+                ): selector.ObjectSelector(),
+            }
+        ),
+        validate_user_input=validate_options,
+    ),
 }
 
 
@@ -37,8 +164,10 @@ class SummaryAgentFlowHandler(SchemaConfigFlowHandler, domain=DOMAIN):
     """Config flow for synthetic_home."""
 
     config_flow = CONFIG_FLOW
+    options_flow = OPTIONS_FLOW
 
     VERSION = 1
+    MINOR_VERSION = 2
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
     def async_config_entry_title(self, options: Mapping[str, Any]) -> str:
@@ -1,10 +1,108 @@
 """Constants for Summary Agent."""
 
+import datetime
+
 DOMAIN = "summary_agent"
 
+# Fired when the summary of an area changes
+EVENT_SUMMARY_UPDATED = "summary_agent_summary_updated"
+
 CONF_AGENT_ID = "agent_id"
+# Additional backing agents to spread summary requests across
+CONF_AGENT_POOL = "agent_pool"
+CONF_LOAD_BALANCING = "load_balancing"
+DEFAULT_LOAD_BALANCING = "round_robin"
+# Weather entity summarized by the weather summary sensor
+CONF_WEATHER_ENTITY = "weather_entity"
+CONF_QUANTIZATION = "quantization"
+CONF_LOCAL_FAST_PATH = "local_fast_path"
+# Number of recent prompts to capture per summary agent, or 0 to disable
+CONF_CAPTURE_SIZE = "capture_size"
+# Number of recent summaries of each sensor kept in the store, 0 to disable
+CONF_HISTORY_SIZE = "history_size"
+# Sensors summarizing a prompt template, see custom_summary.py
+CONF_CUSTOM_SUMMARIES = "custom_summaries"
+
+# Time to wait for the backing agent before using a fallback response
+AGENT_TIMEOUT = datetime.timedelta(seconds=60)
+
+# Maximum length of a summary, which must fit in the state of a sensor
+SUMMARY_MAX_LENGTH = 255
+
+# Bucket sizes for quantizing numeric states in prompts, keyed by device
+# class or unit of measurement. Device class takes precedence over unit.
+DEFAULT_QUANTIZATION: dict[str, float] = {
+    "temperature": 1,
+    "humidity": 5,
+    "battery": 5,
+    "power": 50,
+    "illuminance": 50,
+    "signal_strength": 5,
+    "%": 5,
+}
+
+CONF_SIGNIFICANCE_THRESHOLD = "significance_threshold"
+CONF_SIGNIFICANCE_WEIGHTS = "significance_weights"
+CONF_MAX_AGE = "max_age"
+# Reuse the last summary when the area is at least this similar, unset to disable
+CONF_SIMILARITY_THRESHOLD = "similarity_threshold"
+# Only refresh summaries of areas that are in use
+CONF_LAZY = "lazy"
+CONF_LAZY_MAX_AGE = "lazy_max_age"
+
+# Accumulated significance of area changes required to regenerate a summary
+DEFAULT_SIGNIFICANCE_THRESHOLD = 5.0
+# Maximum age in minutes of an area summary before it is regenerated anyway
+DEFAULT_MAX_AGE = 120
+# Maximum age in minutes of a summary of an area that is not in use in lazy mode
+DEFAULT_LAZY_MAX_AGE = 1440
+
+DEFAULT_SIGNIFICANCE_WEIGHTS: dict[str, dict[str, float]] = {
+    "domain": {
+        "alarm_control_panel": 10,
+        "lock": 10,
+        "cover": 5,
+        "media_player": 3,
+        "climate": 3,
+        "binary_sensor": 3,
+        "light": 2,
+        "switch": 2,
+        "fan": 2,
+        "sensor": 1,
+    },
+    "device_class": {
+        "smoke": 20,
+        "gas": 20,
+        "carbon_monoxide": 20,
+        "moisture": 15,
+        "safety": 15,
+        "door": 8,
+        "garage_door": 8,
+        "lock": 8,
+        "problem": 8,
+        "window": 6,
+        "opening": 6,
+        "motion": 1,
+        "occupancy": 1,
+        "temperature": 1,
+        "battery": 1,
+        "humidity": 0.5,
+        "power": 0.5,
+        "illuminance": 0.5,
+        "energy": 0.2,
+        "signal_strength": 0,
+    },
+    "transition": {
+        "alarm_control_panel.triggered": 20,
+        "lock.jammed": 20,
+        "lock.unlocked": 10,
+        "lock.open": 10,
+    },
+}
 
 AREA_SUMMARY = "area-summary"
+TEMPLATE_SUMMARY = "teamplte"
+CUSTOM_SUMMARY = "custom-summary"
 AREA_SUMMARY_SYSTEM_PROMPT = """
 You are a Home Automation Agent for Home Assistant tasked with summarizing
 the status of an area of the home. Your summaries are succinct, and do not
@@ -41,21 +139,42 @@ Please summarize the following area in less than 255 characters:
 Area: {{ area }}
 {%- set devices = area_devices(area) -%}
 {% for device in devices -%}
-    {%- set iterated = true %}
-    {%- if not device_attr(device, "disabled_by") and not device_attr(device, "entry_type") and device_attr(device, "name") %}
-    {%- set device_name = device_attr(device, "name_by_user") | default(device_attr(device, "name"), True) %}
+    {%- set fragment = device_fragment(device) %}
+    {%- if fragment %}
+{{ fragment }}
+    {%- endif %}
+{%- endfor %}
+{%- if not devices %}
+- No devices
+{%- endif %}
+Summary:
+"""
+
+# Rendered once per device and cached until the device or its entities change
+AREA_SUMMARY_DEVICE_PROMPT = """
+{%- if not device_attr(device, "disabled_by") and not device_attr(device, "entry_type") and device_attr(device, "name") %}
+{%- set device_name = device_attr(device, "name_by_user") | default(device_attr(device, "name"), True) %}
 - {{ device_name  }}{% if device_attr(device, "model") and (device_attr(device, "model") | string) not in (device_attr(device, "name") | string) %} ({{ device_attr(device, "model") }}){% endif %}
-    {%- set entity_info = namespace(printed=false) %}
     {%- for entity_id in device_entities(device) -%}
     {%- set entity_name = state_attr(entity_id, "friendly_name") | replace(device_name, "") | trim %}
   - {{ entity_id.split(".")[0] -}}
     {%- if entity_name %} {{ entity_name }}{% endif -%}
-    : {{ states(entity_id, rounded=True, with_unit=True) }}
+    : {{ quantize(entity_id) or states(entity_id, rounded=True, with_unit=True) }}
     {%- endfor %}
 {%- endif %}
-{%- endfor %}
-{%- if not devices %}
-- No devices
-{%- endif %}
-Summary:
+"""
+
+WEATHER_SUMMARY = "weather-summary"
+WEATHER_SUMMARY_PROMPT = """
+It is {{ now().strftime("%A %B %d") }}.
+
+You are a Home Automation Agent for Home Assistant tasked with summarizing
+the weather forecast. Your summaries are succinct and you do not elaborate
+with mundane minor details about unimportant aspects of the weather. A
+one sentence summary is best.
+
+Forecast for the next hours:
+{{ forecast }}
+
+Please summarize the forecast in less than 255 characters:
 """
@@ -1,17 +1,28 @@
 """Entity for conversation integration."""
 
+import asyncio
+from contextlib import ExitStack
+from dataclasses import replace
+import json
 import logging
+import time
+from collections.abc import Callable
+from typing import Any
 from typing import Literal
 from abc import abstractmethod
 
 from homeassistant.const import MATCH_ALL
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
 from homeassistant.components import conversation
-from homeassistant.exceptions import TemplateError
-from homeassistant.helpers import intent, template
+from homeassistant.exceptions import HomeAssistantError, TemplateError
+from homeassistant.helpers import chat_session, intent, template
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.components.conversation import AbstractConversationAgent, ConversationResult
+from homeassistant.util import dt as dt_util
+from homeassistant.components.conversation import (
+    AbstractConversationAgent,
+    ConversationResult,
+)
 from homeassistant.components.conversation.agent_manager import (
     async_get_agent,
     get_agent_manager,
@@ -20,10 +31,29 @@ from homeassistant.components.conversation.agent_manager import (
 
 from .const import (
     AREA_SUMMARY_SYSTEM_PROMPT,
-    CONF_AGENT_ID,
+    CONF_QUANTIZATION,
+    CONF_LOCAL_FAST_PATH,
+    CONF_CAPTURE_SIZE,
+    AGENT_TIMEOUT,
+    DOMAIN,
     AREA_SUMMARY_USER_PROMPT,
+    AREA_SUMMARY_DEVICE_PROMPT,
     AREA_SUMMARY,
+    DEFAULT_QUANTIZATION,
+    SUMMARY_MAX_LENGTH,
+    TEMPLATE_SUMMARY,
+    WEATHER_SUMMARY,
+    WEATHER_SUMMARY_PROMPT,
 )
+from .agent_pool import AgentPool
+from .capture import PromptCapture, PromptCaptureBuffer
+from .forecast import async_get_compressed_forecast
+from .engine import DATA_ENGINE, SummaryEngine
+from .local_summary import async_resolve_area, async_summarize_area
+from .models import SummaryAgentData
+from .quantize import async_quantize_func
+from .response_budget import ResponseBudget
+from .template_summary import TemplateSummary
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,12 +67,23 @@ async def async_setup_entry(
     """Set up conversation entities."""
 
     manager = get_agent_manager(hass)  # type: ignore[misc]
-    agent_id = config_entry.options[CONF_AGENT_ID]
-    entities = [
-        AreaSummaryConversationEntity(agent_id),
-        TemplateConversationEntity(agent_id),
+    data: SummaryAgentData = hass.data[DOMAIN][config_entry.entry_id]
+    capture_size = int(config_entry.options.get(CONF_CAPTURE_SIZE, 0))
+    entry_id = config_entry.entry_id
+    entities: list[BaseAgentConversationEntity] = [
+        AreaSummaryConversationEntity(
+            entry_id,
+            data.pool,
+            capture_size,
+            hass.data[DATA_ENGINE],
+            config_entry.options.get(CONF_QUANTIZATION, DEFAULT_QUANTIZATION),
+            config_entry.options.get(CONF_LOCAL_FAST_PATH, False),
+        ),
+        TemplateConversationEntity(entry_id, data.pool, capture_size),
+        WeatherSummaryConversationEntity(entry_id, data.pool, capture_size),
     ]
     async_add_entities(entities)
+    data.agents.extend(entities)
     for entity in entities:
         manager.async_set_agent(entity.entity_id, entity)
 
@@ -53,10 +94,21 @@ class BaseAgentConversationEntity(
     """Conversation agent that summarizes an areas."""
 
     _attr_has_entity_name = True
+    # Streamed responses are ended once they are longer than this
+    _max_length: int | None = None
+    # Set by agents that override async_generate_fallback
+    _has_fallback = False
 
-    def __init__(self, agent_id: str) -> None:
+    def __init__(
+        self, config_entry_id: str, pool: AgentPool, capture_size: int = 0
+    ) -> None:
         """Initialize BaseAgentConversationEntity."""
-        self._agent_id = agent_id
+        # Scoped to the config entry so that several entries can be set up
+        self._attr_unique_id = f"{config_entry_id}-{self._attr_unique_id}"
+        self._pool = pool
+        self.captures: PromptCaptureBuffer | None = (
+            PromptCaptureBuffer(capture_size) if capture_size > 0 else None
+        )
 
     @property
     def supported_languages(self) -> list[str] | Literal["*"]:
@@ -71,28 +123,77 @@ class BaseAgentConversationEntity(
             prompt = self.async_generate_prompt(user_input.text)
         except TemplateError as err:
             _LOGGER.error("Error rendering prompt: %s", err)
-            intent_response = intent.IntentResponse(language=user_input.language)
-            intent_response.async_set_error(
-                intent.IntentResponseErrorCode.UNKNOWN,
-                f"Sorry, I had a problem with my template: {err}",
+            return self._async_error_result(
+                user_input, f"Sorry, I had a problem with my template: {err}"
             )
-            return conversation.ConversationResult(
-                response=intent_response,
-                conversation_id=user_input.conversation_id,
+
+        if (agent_id := self._pool.async_select()) is None:
+            if (fallback := self.async_generate_fallback(user_input.text)) is not None:
+                return self._async_speech_result(user_input, fallback)
+            return self._async_error_result(
+                user_input, "Sorry, the conversation agent is unavailable"
             )
+        return await self.async_process_prompt(user_input, prompt, agent_id)
 
+    async def async_process_prompt(
+        self,
+        user_input: conversation.ConversationInput,
+        prompt: str,
+        agent_id: str,
+        capture: bool = True,
+    ) -> conversation.ConversationResult:
+        """Send a rendered prompt to the backing agent and process the response."""
         agent_input = conversation.ConversationInput(
             text=prompt,
             context=user_input.context,
             language=user_input.language,
             conversation_id=user_input.conversation_id,
             device_id=user_input.device_id,
-            agent_id=self._agent_id,
+            agent_id=agent_id,
         )
-        if not (agent := async_get_agent(self.hass, self._agent_id)):
-            raise ValueError(f"Unable to find agent {self._agent_id}")
+        if not (agent := async_get_agent(self.hass, agent_id)):
+            self._pool.async_request_started(agent_id)
+            self._pool.async_request_finished(agent_id, 0, success=False)
+            if (fallback := self.async_generate_fallback(user_input.text)) is None:
+                raise ValueError(f"Unable to find agent {agent_id}")
+            _LOGGER.warning("Unable to find agent %s, using fallback", agent_id)
+            return self._async_speech_result(user_input, fallback)
+
+        # Slow agents are only cut off when there is a fallback to answer with
+        timeout = AGENT_TIMEOUT.total_seconds() if self._has_fallback else None
+        start = time.monotonic()
+        self._pool.async_request_started(agent_id)
+        success = False
+        try:
+            async with asyncio.timeout(timeout):
+                result = await self._async_call_agent(agent, agent_input)
+            success = result.response.response_type != intent.IntentResponseType.ERROR
+        except (HomeAssistantError, TimeoutError) as err:
+            if capture:
+                self._async_capture(
+                    agent_input, user_input.text, start, None, repr(err)
+                )
+            if (fallback := self.async_generate_fallback(user_input.text)) is None:
+                if isinstance(err, TimeoutError):
+                    raise HomeAssistantError(
+                        f"Timeout waiting for agent {agent_id}"
+                    ) from err
+                raise
+            _LOGGER.warning("Error from agent %s, using fallback: %s", agent_id, err)
+            return self._async_speech_result(user_input, fallback)
+        finally:
+            self._pool.async_request_finished(
+                agent_id, time.monotonic() - start, success
+            )
+        if result.response.response_type == intent.IntentResponseType.ERROR:
+            error = result.response.speech.get("plain", {}).get("speech")
+            if capture:
+                self._async_capture(agent_input, user_input.text, start, None, error)
+            if (fallback := self.async_generate_fallback(user_input.text)) is not None:
+                _LOGGER.warning("Agent %s returned an error, using fallback", agent_id)
+                return self._async_speech_result(user_input, fallback)
+            return result
 
-        result: ConversationResult = await agent.async_process(agent_input)
         speech = result.response.speech
         if "plain" not in speech:
             speech["plain"] = {}
@@ -100,16 +201,121 @@ class BaseAgentConversationEntity(
         if "speech" not in plain:
             plain["speech"] = {}
         speech_text = plain["speech"]
+        if capture:
+            self._async_capture(agent_input, user_input.text, start, speech_text)
         plain["speech"] = self.async_process_response_text(speech_text)
         return result
 
+    async def _async_call_agent(
+        self,
+        agent: AbstractConversationAgent | conversation.ConversationEntity,
+        agent_input: conversation.ConversationInput,
+    ) -> ConversationResult:
+        """Call the backing agent, ending a streamed response at the length budget."""
+        if self._max_length is None:
+            return await agent.async_process(agent_input)
+        budget = ResponseBudget(self._max_length)
+        task: asyncio.Task[ConversationResult] | None = None
+        exhausted = False
+
+        @callback
+        def async_chat_log_delta(
+            chat_log: conversation.ChatLog, delta: dict[str, Any]
+        ) -> None:
+            nonlocal exhausted
+            if exhausted or task is None or not (content := delta.get("content")):
+                return
+            if budget.add(content):
+                _LOGGER.debug(
+                    "Response from %s exceeded the length budget", agent_input.agent_id
+                )
+                exhausted = True
+                task.cancel()
+
+        with ExitStack() as stack:
+            session = stack.enter_context(
+                chat_session.async_get_chat_session(
+                    self.hass, agent_input.conversation_id
+                )
+            )
+            try:
+                stack.enter_context(
+                    conversation.async_get_chat_log(
+                        self.hass, session, chat_log_delta_listener=async_chat_log_delta
+                    )
+                )
+            except RuntimeError:
+                # The chat log of the conversation is already followed by the caller
+                return await agent.async_process(agent_input)
+            agent_input = replace(agent_input, conversation_id=session.conversation_id)
+            task = self.hass.async_create_task(
+                agent.async_process(agent_input), eager_start=False
+            )
+            try:
+                return await task
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if not exhausted or (current is not None and current.cancelling()):
+                    raise
+            return self._async_speech_result(agent_input, budget.text)
+
+    def _async_capture(
+        self,
+        agent_input: conversation.ConversationInput,
+        input_text: str,
+        start: float,
+        response: str | None,
+        error: str | None = None,
+    ) -> None:
+        """Record the prompt and response when captures are enabled."""
+        if self.captures is None:
+            return
+        self.captures.async_record(
+            PromptCapture(
+                timestamp=dt_util.utcnow(),
+                entity_id=self.entity_id,
+                agent_id=agent_input.agent_id,
+                input_text=input_text,
+                prompt=agent_input.text,
+                response=response,
+                duration=time.monotonic() - start,
+                error=error,
+            )
+        )
+
     async def async_prepare(self, language: str | None = None) -> None:
         """Load intents for a language."""
 
+    def _async_speech_result(
+        self, user_input: conversation.ConversationInput, speech: str
+    ) -> conversation.ConversationResult:
+        """Return a result answered without the backing agent."""
+        intent_response = intent.IntentResponse(language=user_input.language)
+        intent_response.async_set_speech(speech)
+        return conversation.ConversationResult(
+            response=intent_response,
+            conversation_id=user_input.conversation_id,
+        )
+
+    def _async_error_result(
+        self, user_input: conversation.ConversationInput, message: str
+    ) -> conversation.ConversationResult:
+        """Return an error result without calling the backing agent."""
+        intent_response = intent.IntentResponse(language=user_input.language)
+        intent_response.async_set_error(intent.IntentResponseErrorCode.UNKNOWN, message)
+        return conversation.ConversationResult(
+            response=intent_response,
+            conversation_id=user_input.conversation_id,
+        )
+
     @abstractmethod
     def async_generate_prompt(self, input_text: str) -> str:
         """Generate a prompt for the user."""
 
+    def async_generate_fallback(self, input_text: str) -> str | None:
+        """Generate a response to use when the backing agent fails, if any."""
+        return None
+
     def async_process_response_text(self, output_text: str) -> str:
         """Invoked when the response is generated to allow for side effects."""
         return output_text
@@ -120,18 +326,82 @@ class AreaSummaryConversationEntity(BaseAgentConversationEntity):
 
     _attr_name = "Area Summary"
     _attr_unique_id = AREA_SUMMARY
+    _max_length = SUMMARY_MAX_LENGTH
+    _has_fallback = True
+
+    def __init__(
+        self,
+        config_entry_id: str,
+        pool: AgentPool,
+        capture_size: int,
+        engine: SummaryEngine,
+        quantization: dict[str, float],
+        local_fast_path: bool,
+    ) -> None:
+        """Initialize AreaSummaryConversationEntity."""
+        super().__init__(config_entry_id, pool, capture_size)
+        self._engine = engine
+        self._quantization = quantization
+        # Rendered text is shared with other entries with the same policy
+        self._variant = json.dumps(quantization, sort_keys=True)
+        self._local_fast_path = local_fast_path
+
+    async def async_process(
+        self, user_input: conversation.ConversationInput
+    ) -> conversation.ConversationResult:
+        """Process a sentence, answering quiet areas locally when enabled."""
+        if area := async_resolve_area(self.hass, user_input.text):
+            self._engine.demand.async_record_request(area.id, user_input.context)
+            if self._local_fast_path:
+                local_summary = async_summarize_area(self.hass, area)
+                if local_summary.trivial:
+                    return self._async_speech_result(user_input, local_summary.text)
+        return await super().async_process(user_input)
+
+    def async_generate_fallback(self, input_text: str) -> str | None:
+        """Summarize the area with local rules when the backing agent fails."""
+        if (area := async_resolve_area(self.hass, input_text)) is None:
+            return None
+        return async_summarize_area(self.hass, area).text
 
     def async_generate_prompt(self, text: str) -> str:
-        """Generate a prompt for the user."""
+        """Generate a prompt for the user, reusing the cached prompt of the area."""
+        if (area := async_resolve_area(self.hass, text)) is None:
+            return self._async_render_prompt(text)
+        return self._engine.prompts.async_get(
+            area.id,
+            (text, self._variant),
+            lambda: self._async_render_prompt(text),
+        )
+
+    def _async_render_prompt(self, text: str) -> str:
+        """Render the prompt for an area."""
         raw_prompt = "\n".join(
             [
                 AREA_SUMMARY_SYSTEM_PROMPT,
                 AREA_SUMMARY_USER_PROMPT,
             ]
         )
+        quantize = async_quantize_func(self.hass, self._quantization)
+        device_template = template.Template(AREA_SUMMARY_DEVICE_PROMPT, self.hass)
+
+        def render_device(device_id: str) -> str:
+            return str(
+                device_template.async_render(
+                    {"device": device_id, "quantize": quantize}, parse_result=False
+                )
+            )
+
+        def device_fragment(device_id: str) -> str:
+            return self._engine.fragments.async_get(
+                device_id, self._variant, render_device
+            )
+
         result = template.Template(raw_prompt, self.hass).async_render(
             {
                 "area": text,
+                "quantize": quantize,
+                "device_fragment": device_fragment,
             },
             parse_result=False,
         )
@@ -142,7 +412,60 @@ class TemplateConversationEntity(BaseAgentConversationEntity):
     """Conversation agent that expands a template."""
 
     _attr_name = "Template"
-    _attr_unique_id = "teamplte"
+    _attr_unique_id = TEMPLATE_SUMMARY
+
+    def __init__(
+        self, config_entry_id: str, pool: AgentPool, capture_size: int = 0
+    ) -> None:
+        """Initialize TemplateConversationEntity."""
+        super().__init__(config_entry_id, pool, capture_size)
+        self.template_summaries: dict[TemplateSummary, CALLBACK_TYPE] = {}
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop tracking registered template summaries."""
+        for stop in self.template_summaries.values():
+            stop()
+        self.template_summaries.clear()
+
+    @callback
+    def async_register_summary(
+        self, template_str: str, update_callback: Callable[[str], None]
+    ) -> CALLBACK_TYPE:
+        """Register a template that is summarized whenever its prompt changes.
+
+        The update callback is called with each new summary. Returns a callback
+        that unregisters the template.
+        """
+        summary = TemplateSummary(
+            self.hass, template_str, self._async_summarize_prompt, update_callback
+        )
+        self.template_summaries[summary] = summary.async_start()
+
+        @callback
+        def async_unregister() -> None:
+            if (stop := self.template_summaries.pop(summary, None)) is not None:
+                stop()
+
+        return async_unregister
+
+    async def _async_summarize_prompt(
+        self, template_str: str, prompt: str
+    ) -> str | None:
+        """Send a prompt rendered from a registered template to the backing agent."""
+        user_input = conversation.ConversationInput(
+            text=template_str,
+            context=Context(),
+            conversation_id=None,
+            device_id=None,
+            language=self.hass.config.language,
+            agent_id=self.entity_id,
+        )
+        if (agent_id := self._pool.async_select()) is None:
+            return None
+        result = await self.async_process_prompt(user_input, prompt, agent_id)
+        if result.response.response_type == intent.IntentResponseType.ERROR:
+            return None
+        return str(result.response.speech["plain"]["speech"])
 
     def async_generate_prompt(self, text: str) -> str:
         """Generate a prompt for the user."""
@@ -154,3 +477,51 @@ class TemplateConversationEntity(BaseAgentConversationEntity):
     def async_process_response_text(self, output_text: str) -> str:
         """Invoked when the response is generated to allow for side effects."""
         return output_text
+
+
+class WeatherSummaryConversationEntity(BaseAgentConversationEntity):
+    """Conversation agent that summarizes the forecast of a weather entity."""
+
+    _attr_name = "Weather Summary"
+    _attr_unique_id = WEATHER_SUMMARY
+    _max_length = SUMMARY_MAX_LENGTH
+
+    def __init__(
+        self, config_entry_id: str, pool: AgentPool, capture_size: int = 0
+    ) -> None:
+        """Initialize WeatherSummaryConversationEntity."""
+        super().__init__(config_entry_id, pool, capture_size)
+        self._forecasts: dict[str, str] = {}
+        self._provided_forecasts: dict[str, str] = {}
+
+    @callback
+    def async_provide_forecast(self, entity_id: str, forecast: str) -> None:
+        """Use a compressed forecast the caller just fetched for the next request."""
+        self._provided_forecasts[entity_id] = forecast
+
+    async def async_process(
+        self, user_input: conversation.ConversationInput
+    ) -> conversation.ConversationResult:
+        """Fetch and compress the forecast of the weather entity in the input."""
+        entity_id = user_input.text.strip()
+        if (forecast := self._provided_forecasts.pop(entity_id, None)) is not None:
+            self._forecasts[entity_id] = forecast
+            return await super().async_process(user_input)
+        try:
+            self._forecasts[entity_id] = await async_get_compressed_forecast(
+                self.hass, entity_id
+            )
+        except HomeAssistantError as err:
+            _LOGGER.error("Error fetching forecast for %s: %s", entity_id, err)
+            return self._async_error_result(
+                user_input, f"Sorry, I could not get the forecast: {err}"
+            )
+        return await super().async_process(user_input)
+
+    def async_generate_prompt(self, text: str) -> str:
+        """Generate a prompt from the last compressed forecast of the entity."""
+        result = template.Template(WEATHER_SUMMARY_PROMPT, self.hass).async_render(
+            {"forecast": self._forecasts.get(text.strip(), "No forecast available")},
+            parse_result=False,
+        )
+        return str(result)
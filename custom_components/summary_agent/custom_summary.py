@@ -0,0 +1,68 @@
+"""Custom summaries defined in the options as a prompt template.
+
+Each custom summary is a sensor that renders its prompt template and asks the
+Template agent for a summary. Summaries are refreshed either when the entities
+read by the template change or on an interval, and share the scheduling,
+concurrency limit and backing agent pool of the area summary sensors.
+"""
+
+from enum import StrEnum
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import slugify
+
+CONF_NAME = "name"
+CONF_PROMPT = "prompt"
+CONF_REFRESH = "refresh"
+CONF_INTERVAL = "interval"
+CONF_RATE_LIMIT = "rate_limit"
+
+# Minutes between refreshes of an interval summary
+DEFAULT_INTERVAL = 60
+# Interval summaries are refreshed by the sensor platform timer
+MIN_INTERVAL = 15
+# Minutes between summaries of a summary following its template
+DEFAULT_RATE_LIMIT = 5
+
+
+class RefreshPolicy(StrEnum):
+    """When a custom summary is refreshed."""
+
+    CHANGE = "change"
+    """When the rendered prompt changes, at most once per rate limit."""
+
+    INTERVAL = "interval"
+    """On an interval, when the rendered prompt is different."""
+
+
+CUSTOM_SUMMARY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(CONF_PROMPT): cv.template,
+        vol.Optional(CONF_REFRESH, default=RefreshPolicy.CHANGE): vol.Coerce(
+            RefreshPolicy
+        ),
+        vol.Optional(CONF_INTERVAL, default=DEFAULT_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=MIN_INTERVAL)
+        ),
+        vol.Optional(CONF_RATE_LIMIT, default=DEFAULT_RATE_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+
+def _unique_names(custom_summaries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Validate that custom summaries have distinct names for their unique ids."""
+    names = [slugify(custom_summary[CONF_NAME]) for custom_summary in custom_summaries]
+    if len(names) != len(set(names)):
+        raise vol.Invalid("Custom summary names must be unique")
+    return custom_summaries
+
+
+CUSTOM_SUMMARIES_SCHEMA = vol.All(
+    cv.ensure_list, [CUSTOM_SUMMARY_SCHEMA], _unique_names
+)
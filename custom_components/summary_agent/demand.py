@@ -0,0 +1,79 @@
+"""Tracking of which area summaries are being used.
+
+In lazy mode an area summary is only refreshed while someone is using it: a
+websocket subscriber is watching the area, an automation or script references
+the summary sensor, or the area was recently requested from the agent.
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+import datetime
+
+from homeassistant.components.automation import automations_with_entity
+from homeassistant.components.script import scripts_with_entity
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+# An area requested from the agent is considered in use for this long
+DEMAND_WINDOW = datetime.timedelta(hours=1)
+
+
+class DemandTracker:
+    """Records the use of area summaries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize DemandTracker."""
+        self._hass = hass
+        self._requested: dict[str, datetime.datetime] = {}
+        # Watched area ids, with None for subscribers watching every area
+        self._watchers: Counter[str | None] = Counter()
+        self._internal_contexts: set[str] = set()
+
+    @contextmanager
+    def internal_request(self) -> Iterator[Context]:
+        """Return a context for requests made to refresh a summary.
+
+        Requests made with the context are not counted as demand so that
+        refreshing a summary does not keep the area in use.
+        """
+        context = Context()
+        self._internal_contexts.add(context.id)
+        try:
+            yield context
+        finally:
+            self._internal_contexts.discard(context.id)
+
+    @callback
+    def async_record_request(self, area_id: str, context: Context) -> None:
+        """Record a request for the summary of an area."""
+        if context.id in self._internal_contexts:
+            return
+        self._requested[area_id] = dt_util.utcnow()
+
+    @callback
+    def async_watch(self, area_id: str | None) -> CALLBACK_TYPE:
+        """Record a subscriber watching an area, or every area when None."""
+        self._watchers[area_id] += 1
+
+        @callback
+        def async_unwatch() -> None:
+            self._watchers[area_id] -= 1
+            if not self._watchers[area_id]:
+                del self._watchers[area_id]
+
+        return async_unwatch
+
+    @callback
+    def async_in_use(self, area_id: str, entity_id: str) -> bool:
+        """Return True if the summary of the area is being used."""
+        if self._watchers[None] or self._watchers[area_id]:
+            return True
+        if (requested := self._requested.get(area_id)) is not None:
+            if dt_util.utcnow() - requested < DEMAND_WINDOW:
+                return True
+            del self._requested[area_id]
+        return bool(
+            automations_with_entity(self._hass, entity_id)
+            or scripts_with_entity(self._hass, entity_id)
+        )
@@ -0,0 +1,29 @@
+"""Diagnostics support for Summary Agent."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .engine import DATA_ENGINE
+from .models import SummaryAgentData
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: SummaryAgentData = hass.data[DOMAIN][config_entry.entry_id]
+    return {
+        "options": dict(config_entry.options),
+        "pool": data.pool.as_dict(),
+        "engine": hass.data[DATA_ENGINE].as_dict(),
+        "agents": {
+            agent.entity_id: {
+                "captures": agent.captures.as_list() if agent.captures else None,
+            }
+            for agent in data.agents
+        },
+        "sensors": {sensor.entity_id: sensor.async_tuning() for sensor in data.sensors},
+    }
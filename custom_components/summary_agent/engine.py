@@ -0,0 +1,165 @@
+"""Summary engine shared by all config entries.
+
+Config entries differ only in their backing agents and policies. The area
+index and the caches of rendered prompts are shared so that rendering the
+prompt of each area is done once no matter how many config entries there are.
+Refreshes are not shared: each config entry schedules its own summary sensors
+and is limited to as many refreshes in progress as it has backing agents.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from .area_index import AreaIndex
+from .const import DOMAIN
+from .demand import DemandTracker
+from .fragment_cache import DeviceFragmentCache
+from .publisher import SummaryPublisher
+
+DATA_ENGINE: HassKey["SummaryEngine"] = HassKey(f"{DOMAIN}_engine")
+
+
+class PromptCache:
+    """Rendered area prompts keyed by area id and variant."""
+
+    def __init__(self) -> None:
+        """Initialize PromptCache."""
+        self._prompts: dict[str, dict[Hashable, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_get(
+        self, area_id: str, variant: Hashable, render: Callable[[], str]
+    ) -> str:
+        """Return the prompt for an area, rendering it if not cached."""
+        prompts = self._prompts.setdefault(area_id, {})
+        if (prompt := prompts.get(variant)) is not None:
+            self.hits += 1
+            return prompt
+        self.misses += 1
+        prompt = render()
+        prompts[variant] = prompt
+        return prompt
+
+    @callback
+    def async_invalidate(self, area_id: str) -> None:
+        """Discard the prompts for an area."""
+        self._prompts.pop(area_id, None)
+
+    @callback
+    def async_clear(self) -> None:
+        """Discard all prompts."""
+        self._prompts.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the cache statistics."""
+        return {
+            "size": sum(len(prompts) for prompts in self._prompts.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class SummaryEngine:
+    """Area index and prompt caches shared by all config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize SummaryEngine."""
+        self._hass = hass
+        self.areas = AreaIndex(hass)
+        self.fragments = DeviceFragmentCache()
+        self.prompts = PromptCache()
+        self.publisher = SummaryPublisher(hass)
+        self.demand = DemandTracker(hass)
+        self._refresh_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Invalidate caches and notify the areas of the changed entity."""
+        areas = self.areas.async_get(event.data["entity_id"])
+        self.fragments.async_invalidate(areas.device_id)
+        for area_id in areas.area_ids:
+            self.prompts.async_invalidate(area_id)
+        self.areas.async_dispatch(areas, event)
+
+    @callback
+    def _async_device_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Invalidate caches for a device that changed in the registry."""
+        self.fragments.async_invalidate(event.data["device_id"])
+        self.areas.async_clear()
+        self.prompts.async_clear()
+
+    @callback
+    def _async_registry_updated(self, event: Event[Any]) -> None:
+        """Invalidate all caches when entities or areas change in the registry."""
+        self.fragments.async_clear()
+        self.areas.async_clear()
+        self.prompts.async_clear()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Listen for the changes that invalidate the shared caches."""
+        bus = self._hass.bus
+        unsubs = [
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated
+            ),
+            bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated
+            ),
+            bus.async_listen(
+                ar.EVENT_AREA_REGISTRY_UPDATED, self._async_registry_updated
+            ),
+        ]
+
+        @callback
+        def async_stop() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return async_stop
+
+    @callback
+    def async_add_entry(self, entry_id: str, parallel_refreshes: int) -> CALLBACK_TYPE:
+        """Limit the summary refreshes in flight for a config entry."""
+        self._refresh_semaphores[entry_id] = asyncio.Semaphore(parallel_refreshes)
+
+        @callback
+        def async_remove() -> None:
+            self._refresh_semaphores.pop(entry_id, None)
+
+        return async_remove
+
+    async def async_refresh[_T](
+        self, entry_id: str, target: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run a summary refresh, limiting refreshes in flight for the entry."""
+        async with self._refresh_semaphores[entry_id]:
+            return await target()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the shared cache statistics."""
+        return {
+            "fragments": self.fragments.as_dict(),
+            "prompts": self.prompts.as_dict(),
+        }
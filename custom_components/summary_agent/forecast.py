@@ -0,0 +1,158 @@
+"""Compression of weather forecasts into a short prompt.
+
+A raw hourly forecast is thousands of tokens of mostly repeated values. The
+forecast is reduced to the conditions, the temperature range and the chance of
+precipitation in each part of the day. Parts of the day are named relative to
+the day of the first hour instead of by clock time, and values are rounded, so
+that neither small revisions to the forecast nor the hourly advance of its
+start produce different text. This lets callers skip re-summarizing when
+nothing meaningful changed.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import datetime
+from typing import Any, cast
+
+from homeassistant.components.weather import (
+    ATTR_FORECAST_CONDITION,
+    ATTR_FORECAST_PRECIPITATION,
+    ATTR_FORECAST_PRECIPITATION_PROBABILITY,
+    ATTR_FORECAST_TEMP,
+    ATTR_FORECAST_TIME,
+    ATTR_WEATHER_PRECIPITATION_UNIT,
+    ATTR_WEATHER_TEMPERATURE_UNIT,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+# Number of hours of the forecast included in the prompt
+FORECAST_HOURS = 24
+# Hours with at least this chance of precipitation are part of a window
+PRECIPITATION_PROBABILITY = 30
+# Chance of precipitation is reported in steps of this size
+PROBABILITY_STEP = 10
+# Hour each part of the day starts at with its name today and tomorrow
+DAY_PARTS = (
+    (18, "this evening", "tomorrow evening"),
+    (12, "this afternoon", "tomorrow afternoon"),
+    (6, "this morning", "tomorrow morning"),
+    (0, "early this morning", "overnight"),
+)
+
+
+@dataclass
+class ForecastHour:
+    """A single hour of the forecast."""
+
+    time: datetime.datetime
+    condition: str | None
+    temperature: float | None
+    precipitation: float | None
+    precipitation_probability: float | None
+
+    @property
+    def wet(self) -> bool:
+        """Return True if precipitation is expected in this hour."""
+        if self.precipitation_probability is not None:
+            return self.precipitation_probability >= PRECIPITATION_PROBABILITY
+        return bool(self.precipitation)
+
+
+def _parse_forecast(forecast: Iterable[dict[str, Any]]) -> list[ForecastHour]:
+    """Parse the forecast returned by the weather entity."""
+    hours = []
+    for item in forecast:
+        if (time := dt_util.parse_datetime(str(item.get(ATTR_FORECAST_TIME)))) is None:
+            continue
+        hours.append(
+            ForecastHour(
+                time=dt_util.as_local(time),
+                condition=item.get(ATTR_FORECAST_CONDITION),
+                temperature=item.get(ATTR_FORECAST_TEMP),
+                precipitation=item.get(ATTR_FORECAST_PRECIPITATION),
+                precipitation_probability=item.get(
+                    ATTR_FORECAST_PRECIPITATION_PROBABILITY
+                ),
+            )
+        )
+    return hours[:FORECAST_HOURS]
+
+
+def _day_part(time: datetime.datetime, today: datetime.date) -> str:
+    """Return the name of the part of the day of an hour of the forecast."""
+    _, this, next_ = next(part for part in DAY_PARTS if time.hour >= part[0])
+    return this if time.date() == today else next_
+
+
+def _runs(
+    hours: list[ForecastHour], key: Callable[[ForecastHour], Any]
+) -> Iterable[list[ForecastHour]]:
+    """Group consecutive hours with the same key."""
+    run: list[ForecastHour] = []
+    for hour in hours:
+        if run and key(run[-1]) != key(hour):
+            yield run
+            run = []
+        run.append(hour)
+    if run:
+        yield run
+
+
+def compress_forecast(
+    forecast: Iterable[dict[str, Any]],
+    temperature_unit: str | None = None,
+    precipitation_unit: str | None = None,
+) -> str:
+    """Return a compact text description of an hourly forecast."""
+    hours = _parse_forecast(forecast)
+    if not hours:
+        return "No forecast available"
+    lines = []
+    today = hours[0].time.date()
+    for run in _runs(hours, lambda hour: _day_part(hour.time, today)):
+        conditions = dict.fromkeys(hour.condition or "unknown" for hour in run)
+        details = [" then ".join(conditions)]
+        if temperatures := [
+            round(hour.temperature) for hour in run if hour.temperature is not None
+        ]:
+            unit = f" {temperature_unit}" if temperature_unit else ""
+            low, high = min(temperatures), max(temperatures)
+            details.append(f"{low}{unit}" if low == high else f"{low} to {high}{unit}")
+        if wet := [hour for hour in run if hour.wet]:
+            probabilities = [
+                hour.precipitation_probability
+                for hour in wet
+                if hour.precipitation_probability is not None
+            ]
+            if probabilities:
+                chance = round(max(probabilities) / PROBABILITY_STEP) * PROBABILITY_STEP
+                details.append(f"up to {chance}% chance of precipitation")
+            if total := sum(hour.precipitation or 0.0 for hour in wet):
+                unit = f" {precipitation_unit}" if precipitation_unit else ""
+                details.append(f"{round(total, 1)}{unit} precipitation")
+        lines.append(f"- {_day_part(run[0].time, today)}: {', '.join(details)}")
+    if not any(hour.wet for hour in hours):
+        lines.append("Precipitation: none expected")
+    return "\n".join(lines)
+
+
+async def async_get_compressed_forecast(hass: HomeAssistant, entity_id: str) -> str:
+    """Fetch the hourly forecast of a weather entity and compress it."""
+    if (state := hass.states.get(entity_id)) is None:
+        raise HomeAssistantError(f"Unable to find weather entity {entity_id}")
+    response = await hass.services.async_call(
+        "weather",
+        "get_forecasts",
+        {"type": "hourly"},
+        target={"entity_id": entity_id},
+        blocking=True,
+        return_response=True,
+    )
+    forecast = (response or {}).get(entity_id, {}).get("forecast", [])  # type: ignore[union-attr]
+    return compress_forecast(
+        cast(list[dict[str, Any]], forecast),
+        state.attributes.get(ATTR_WEATHER_TEMPERATURE_UNIT),
+        state.attributes.get(ATTR_WEATHER_PRECIPITATION_UNIT),
+    )
@@ -0,0 +1,58 @@
+"""Cache of the rendered prompt text for each device.
+
+Rendering an area prompt formats every entity of every device in the area. The
+text for a device only changes when one of its entities changes state or when
+the device or its entities change in the registry, so the rendered fragment is
+kept until then and the area prompt is assembled from cached fragments.
+
+Agents with different quantization policies render different text for the
+same device, so fragments are also keyed by a variant chosen by the agent.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import callback
+
+
+class DeviceFragmentCache:
+    """Rendered prompt fragments keyed by device id and variant."""
+
+    def __init__(self) -> None:
+        """Initialize DeviceFragmentCache."""
+        self._fragments: dict[str, dict[str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_get(
+        self, device_id: str, variant: str, render: Callable[[str], str]
+    ) -> str:
+        """Return the fragment for a device, rendering it if not cached."""
+        fragments = self._fragments.setdefault(device_id, {})
+        if (fragment := fragments.get(variant)) is not None:
+            self.hits += 1
+            return fragment
+        self.misses += 1
+        fragment = render(device_id)
+        fragments[variant] = fragment
+        return fragment
+
+    @callback
+    def async_invalidate(self, device_id: str | None) -> None:
+        """Discard the fragments for a device."""
+        if device_id is not None:
+            self._fragments.pop(device_id, None)
+
+    @callback
+    def async_clear(self) -> None:
+        """Discard all fragments."""
+        self._fragments.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the cache statistics."""
+        return {
+            "size": sum(len(fragments) for fragments in self._fragments.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,72 @@
+"""Compact history of area summaries kept in the integration's own store.
+
+Summary sensor attributes used for tuning are excluded from the recorder and
+the state is only written when the summary changes. When enabled in the
+options, the most recent summaries of each sensor are also kept in a bounded
+store so the history of an area can be reviewed without the recorder.
+"""
+
+from collections import deque
+import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Delay in seconds used to batch writes of new summaries to the store
+SAVE_DELAY = 60
+
+
+def _storage_key(entry_id: str) -> str:
+    """Return the storage key for the history of a config entry."""
+    return f"{DOMAIN}.{entry_id}.history"
+
+
+class SummaryHistory:
+    """The most recent summaries of each sensor of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, size: int) -> None:
+        """Initialize SummaryHistory."""
+        self._store: Store[dict[str, list[dict[str, str]]]] = Store(
+            hass, STORAGE_VERSION, _storage_key(entry_id)
+        )
+        self._size = size
+        self._history: dict[str, deque[dict[str, str]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the history from the store."""
+        data = await self._store.async_load() or {}
+        self._history = {
+            entity_id: deque(entries, maxlen=self._size)
+            for entity_id, entries in data.items()
+        }
+
+    @callback
+    def async_record(
+        self, entity_id: str, summary: str, last_updated: datetime.datetime
+    ) -> None:
+        """Record a new summary, evicting the oldest when the history is full."""
+        entries = self._history.setdefault(entity_id, deque(maxlen=self._size))
+        if entries and entries[-1]["summary"] == summary:
+            return
+        entries.append({"summary": summary, "time": last_updated.isoformat()})
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, list[dict[str, str]]]:
+        """Return the history to write to the store."""
+        return {
+            entity_id: list(entries) for entity_id, entries in self._history.items()
+        }
+
+    def as_list(self, entity_id: str) -> list[dict[str, Any]]:
+        """Return the history of a sensor, oldest first."""
+        return list(self._history.get(entity_id, ()))
+
+
+async def async_remove_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored history of a config entry that was removed."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
@@ -0,0 +1,183 @@
+"""Rule based area summaries that do not require a conversation agent.
+
+The local summarizer describes the notable states of an area such as open doors,
+unlocked or jammed locks, lights that are on and low batteries. It is used to answer for
+areas where nothing notable is happening and as a fallback when the backing
+conversation agent fails.
+"""
+
+from dataclasses import dataclass
+
+from homeassistant.components.cover import CoverState
+from homeassistant.components.lock import LockState
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    PERCENTAGE,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from .const import DOMAIN
+
+LOW_BATTERY_LEVEL = 20
+
+ALERT_DEVICE_CLASSES = {
+    "carbon_monoxide",
+    "gas",
+    "moisture",
+    "problem",
+    "safety",
+    "smoke",
+    "tamper",
+}
+OPENING_DEVICE_CLASSES = {"door", "garage_door", "opening", "window"}
+ACTIVE_DEVICE_CLASSES = {"motion", "occupancy", "presence", "sound", "vibration"}
+ACTIVE_STATES = {
+    "fan": {STATE_ON},
+    "media_player": {"playing", STATE_ON},
+    "switch": {STATE_ON},
+    "vacuum": {"cleaning"},
+}
+
+
+@dataclass
+class LocalSummary:
+    """A summary of an area built from rules."""
+
+    text: str
+    """The summary of the area."""
+
+    trivial: bool
+    """True when nothing notable is happening in the area."""
+
+
+def async_resolve_area(hass: HomeAssistant, text: str) -> ar.AreaEntry | None:
+    """Return the area with the specified name or id."""
+    area_registry = ar.async_get(hass)
+    return area_registry.async_get_area_by_name(text) or area_registry.async_get_area(
+        text
+    )
+
+
+def async_area_entity_ids(hass: HomeAssistant, area_id: str) -> list[str]:
+    """Return the entities in an area either directly or through their device."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    entries = list(er.async_entries_for_area(entity_registry, area_id))
+    for device in dr.async_entries_for_area(device_registry, area_id):
+        entries.extend(
+            entry
+            for entry in er.async_entries_for_device(entity_registry, device.id)
+            if entry.area_id is None
+        )
+    return [
+        entry.entity_id
+        for entry in entries
+        if entry.platform != DOMAIN and not entry.hidden
+    ]
+
+
+def _join(names: list[str]) -> str:
+    """Join names into a phrase for a sentence."""
+    if len(names) == 1:
+        return names[0]
+    return f"{', '.join(names[:-1])} and {names[-1]}"
+
+
+def _verb(names: list[str]) -> str:
+    """Return the verb agreeing with the number of names."""
+    return "is" if len(names) == 1 else "are"
+
+
+def _low_battery(state: State) -> bool:
+    """Return True if the state represents a low battery."""
+    if state.attributes.get(ATTR_DEVICE_CLASS) != "battery":
+        return False
+    if state.domain == "binary_sensor":
+        return state.state == STATE_ON
+    if state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) != PERCENTAGE:
+        return False
+    try:
+        return float(state.state) < LOW_BATTERY_LEVEL
+    except ValueError:
+        return False
+
+
+def summarize_states(area_name: str, states: list[State]) -> LocalSummary:
+    """Build a summary of an area from the states of its entities."""
+    alerts: list[str] = []
+    opened: list[str] = []
+    unlocked: list[str] = []
+    jammed: list[str] = []
+    lights_on: list[str] = []
+    low_battery: list[str] = []
+    active: list[str] = []
+    has_lights = False
+
+    for state in states:
+        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+        if state.domain == "light":
+            has_lights = True
+            if state.state == STATE_ON:
+                lights_on.append(state.name)
+        elif state.domain == "lock":
+            if state.state == LockState.JAMMED:
+                jammed.append(state.name)
+            elif state.state in (LockState.UNLOCKED, LockState.OPEN):
+                unlocked.append(state.name)
+        elif state.domain == "cover":
+            if state.state in (CoverState.OPEN, CoverState.OPENING):
+                opened.append(state.name)
+        elif state.domain == "binary_sensor" and state.state == STATE_ON:
+            if device_class in ALERT_DEVICE_CLASSES:
+                alerts.append(state.name)
+            elif device_class in OPENING_DEVICE_CLASSES:
+                opened.append(state.name)
+            elif device_class == "lock":
+                unlocked.append(state.name)
+            elif device_class in ACTIVE_DEVICE_CLASSES:
+                active.append(state.name)
+        elif state.state in ACTIVE_STATES.get(state.domain, set()):
+            active.append(state.name)
+        if _low_battery(state):
+            low_battery.append(state.name)
+
+    sentences = []
+    if alerts:
+        sentences.append(f"{_join(alerts)} {_verb(alerts)} reporting a problem.")
+    if jammed:
+        sentences.append(f"{_join(jammed)} {_verb(jammed)} jammed.")
+    if opened:
+        sentences.append(f"{_join(opened)} {_verb(opened)} open.")
+    if unlocked:
+        sentences.append(f"{_join(unlocked)} {_verb(unlocked)} unlocked.")
+    if len(lights_on) == 1:
+        sentences.append(f"{lights_on[0]} is on.")
+    elif lights_on:
+        sentences.append(f"{len(lights_on)} lights are on.")
+    if active:
+        sentences.append(f"{_join(active)} {_verb(active)} active.")
+    if low_battery:
+        sentences.append(f"{_join(low_battery)} {_verb(low_battery)} low on battery.")
+
+    if sentences:
+        return LocalSummary(text=" ".join(sentences), trivial=False)
+    if has_lights:
+        return LocalSummary(text=f"The {area_name} is dark and quiet.", trivial=True)
+    return LocalSummary(text=f"The {area_name} is quiet.", trivial=True)
+
+
+def async_summarize_area(hass: HomeAssistant, area: ar.AreaEntry) -> LocalSummary:
+    """Build a summary of an area from the current states of its entities."""
+    states = [
+        state
+        for entity_id in async_area_entity_ids(hass, area.id)
+        if (state := hass.states.get(entity_id)) is not None
+    ]
+    return summarize_states(area.name, states)
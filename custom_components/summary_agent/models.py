@@ -0,0 +1,28 @@
+"""Data models for Summary Agent."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .agent_pool import AgentPool
+from .history import SummaryHistory
+
+if TYPE_CHECKING:
+    from .conversation import BaseAgentConversationEntity
+    from .sensor import AreaSummarySensorEntity
+
+
+@dataclass
+class SummaryAgentData:
+    """Runtime data for a Summary Agent config entry."""
+
+    pool: AgentPool
+    """Backing conversation agents for the config entry."""
+
+    agents: list["BaseAgentConversationEntity"] = field(default_factory=list)
+    """Summary conversation agents created for the config entry."""
+
+    sensors: list["AreaSummarySensorEntity"] = field(default_factory=list)
+    """Area summary sensors created for the config entry."""
+
+    history: SummaryHistory | None = None
+    """Recent summaries of the sensors of the config entry, if enabled."""
@@ -0,0 +1,83 @@
+"""Publishing of new summaries to event and websocket subscribers."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import EVENT_SUMMARY_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SummaryUpdate:
+    """The current summary of an area."""
+
+    entity_id: str
+    area_id: str
+    area_name: str
+    summary: str
+    last_updated: datetime.datetime
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the update."""
+        return {
+            "entity_id": self.entity_id,
+            "area_id": self.area_id,
+            "area_name": self.area_name,
+            "summary": self.summary,
+            "last_updated": self.last_updated.isoformat(),
+        }
+
+
+class SummaryPublisher:
+    """Keeps the latest summary of each area and notifies subscribers of changes."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize SummaryPublisher."""
+        self._hass = hass
+        self._summaries: dict[str, SummaryUpdate] = {}
+        self._listeners: list[Callable[[SummaryUpdate], None]] = []
+
+    @property
+    def summaries(self) -> list[SummaryUpdate]:
+        """Return the latest summary of every area."""
+        return list(self._summaries.values())
+
+    @callback
+    def async_publish(self, update: SummaryUpdate, notify: bool = True) -> None:
+        """Publish a summary, notifying subscribers only when the text changed.
+
+        A summary restored on startup is published without notifying so that
+        it is only sent to new subscribers as the current value.
+        """
+        previous = self._summaries.get(update.entity_id)
+        self._summaries[update.entity_id] = update
+        if not notify or (previous is not None and previous.summary == update.summary):
+            return
+        _LOGGER.debug("Publishing new summary for %s", update.entity_id)
+        self._hass.bus.async_fire(EVENT_SUMMARY_UPDATED, update.as_dict())
+        for listener in list(self._listeners):
+            listener(update)
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Forget the summary of an entity that was removed."""
+        self._summaries.pop(entity_id, None)
+
+    @callback
+    def async_subscribe(
+        self, listener: Callable[[SummaryUpdate], None]
+    ) -> CALLBACK_TYPE:
+        """Subscribe to summary changes, returning a callback to unsubscribe."""
+        self._listeners.append(listener)
+
+        @callback
+        def unsubscribe() -> None:
+            self._listeners.remove(listener)
+
+        return unsubscribe
@@ -0,0 +1,79 @@
+"""Quantization of numeric states used when rendering prompts.
+
+Sensors such as temperature or power jitter slightly on every refresh. Rounding
+their values into coarse buckets before they are rendered into a prompt means
+insignificant drift produces an identical prompt.
+"""
+
+from collections.abc import Callable, Mapping
+import decimal
+import math
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+
+# Bucket sizes keyed by device class or unit of measurement
+QUANTIZATION_SCHEMA = vol.Schema(
+    {cv.string: vol.All(vol.Coerce(float), vol.Range(min=0, min_included=False))}
+)
+
+
+def quantization_step(
+    policy: Mapping[str, float],
+    device_class: str | None,
+    unit: str | None,
+) -> float | None:
+    """Return the bucket size for a device class or unit, if any.
+
+    The device class takes precedence over the unit of measurement.
+    """
+    for key in (device_class, unit):
+        if key is not None and (step := policy.get(key)):
+            return float(step)
+    return None
+
+
+def quantize_value(value: float, step: float) -> str:
+    """Round the value to the nearest multiple of step and format it."""
+    decimals = max(0, -int(decimal.Decimal(str(step)).normalize().as_tuple().exponent))
+    bucket = math.floor(value / step + 0.5) * step
+    # Adding zero avoids rendering negative zero as "-0"
+    return f"{bucket + 0:.{decimals}f}"
+
+
+def async_quantize_state(
+    hass: HomeAssistant, policy: Mapping[str, float], entity_id: str
+) -> str | None:
+    """Return the quantized state of an entity with its unit.
+
+    Returns None when the entity has no numeric state or no matching policy
+    so the caller can fall back to the default state formatting.
+    """
+    if (state := hass.states.get(entity_id)) is None:
+        return None
+    unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    step = quantization_step(policy, state.attributes.get(ATTR_DEVICE_CLASS), unit)
+    if step is None:
+        return None
+    try:
+        value = float(state.state)
+    except ValueError:
+        return None
+    if not math.isfinite(value):
+        return None
+    result = quantize_value(value, step)
+    return f"{result} {unit}" if unit else result
+
+
+def async_quantize_func(
+    hass: HomeAssistant, policy: Mapping[str, float]
+) -> Callable[[str], str | None]:
+    """Return a function for quantizing entity states from a template."""
+
+    def quantize(entity_id: str) -> str | None:
+        return async_quantize_state(hass, policy, entity_id)
+
+    return quantize
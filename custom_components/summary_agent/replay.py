@@ -0,0 +1,92 @@
+"""Replay of captured prompts against a stand-in conversation agent.
+
+Captures exported through diagnostics are fed back through the summary agents
+with the backing agent replaced so that changes to prompts, caching or
+scheduling can be benchmarked on a real workload.
+"""
+
+from collections.abc import Iterable
+import statistics
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import conversation
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .conversation import BaseAgentConversationEntity
+
+ATTR_CAPTURES = "captures"
+ATTR_RERENDER = "rerender"
+
+CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("input_text"): cv.string,
+        vol.Required("prompt"): cv.string,
+        vol.Optional("response"): vol.Any(cv.string, None),
+        vol.Optional("duration"): vol.Any(vol.Coerce(float), None),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    agents: Iterable[BaseAgentConversationEntity],
+    captures: list[dict[str, Any]],
+    agent_id: str,
+    rerender: bool,
+    context: Context,
+) -> dict[str, Any]:
+    """Replay captures through the summary agents against another agent.
+
+    When rerender is set the prompt is rendered again by the summary agent from
+    the captured input text, otherwise the captured prompt is sent as is.
+    """
+    agents_by_id = {agent.entity_id: agent for agent in agents}
+    results = []
+    for capture in captures:
+        if (agent := agents_by_id.get(capture["entity_id"])) is None:
+            raise ServiceValidationError(
+                f"Unknown summary agent {capture['entity_id']}"
+            )
+        prompt = (
+            agent.async_generate_prompt(capture["input_text"])
+            if rerender
+            else capture["prompt"]
+        )
+        user_input = conversation.ConversationInput(
+            text=capture["input_text"],
+            context=context,
+            conversation_id=None,
+            device_id=None,
+            language=hass.config.language,
+            agent_id=agent.entity_id,
+        )
+        start = time.monotonic()
+        result = await agent.async_process_prompt(
+            user_input, prompt, agent_id, capture=False
+        )
+        results.append(
+            {
+                "entity_id": agent.entity_id,
+                "input_text": capture["input_text"],
+                "prompt_changed": prompt != capture["prompt"],
+                "response": result.response.speech.get("plain", {}).get("speech"),
+                "captured_response": capture.get("response"),
+                "duration": time.monotonic() - start,
+                "captured_duration": capture.get("duration"),
+            }
+        )
+    durations = [result["duration"] for result in results]
+    return {
+        "results": results,
+        "count": len(results),
+        "duration": sum(durations),
+        "latency_p50": statistics.median(durations) if durations else None,
+        "latency_max": max(durations, default=None),
+    }
@@ -0,0 +1,44 @@
+"""Early termination of responses that exceed the length of a summary.
+
+Conversation agents have no common option to limit the length of a response
+or to set stop sequences. Agents that stream their response into the chat log
+report each delta to a listener, so the response is followed as it is
+generated and the request is cancelled once it has grown past the length
+budget. The complete sentences that fit in the budget are used as the response
+and the rest of the generation is never waited on.
+"""
+
+import re
+
+# End of a sentence followed by whitespace
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class ResponseBudget:
+    """Accumulates a streamed response until it no longer fits a length."""
+
+    def __init__(self, max_length: int) -> None:
+        """Initialize ResponseBudget."""
+        self._max_length = max_length
+        self._text = ""
+
+    def add(self, content: str) -> bool:
+        """Add streamed content, returning True once the response is complete.
+
+        The response is complete when it is longer than the budget and at
+        least one complete sentence fits in the budget.
+        """
+        self._text += content
+        return len(self._text.strip()) > self._max_length and bool(self.text)
+
+    @property
+    def text(self) -> str:
+        """Return the complete sentences that fit in the budget."""
+        fitted = ""
+        # The last part is an incomplete sentence until more text arrives
+        for end in SENTENCE_END.finditer(self._text):
+            sentences = self._text[: end.start()].strip()
+            if len(sentences) > self._max_length:
+                break
+            fitted = sentences
+        return fitted
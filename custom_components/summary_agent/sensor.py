@@ -1,32 +1,95 @@
 """Sensor platform for summary agent."""
 
+import asyncio
+from dataclasses import dataclass
 import logging
 import datetime
+from functools import partial
 import textwrap
-from typing import cast
+import time
+from typing import Any, cast
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.const import EntityCategory
-from homeassistant.components.sensor import RestoreSensor
+from homeassistant.components.sensor import RestoreSensor, SensorExtraStoredData
 from homeassistant.helpers import (
     area_registry as ar,
     entity_registry as er,
     device_registry as dr,
 )
+from homeassistant.exceptions import HomeAssistantError, TemplateError
+from homeassistant.helpers import intent, template
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import DOMAIN, AREA_SUMMARY
+from .const import (
+    DOMAIN,
+    AREA_SUMMARY,
+    CONF_CUSTOM_SUMMARIES,
+    CONF_LAZY,
+    CONF_LAZY_MAX_AGE,
+    CONF_MAX_AGE,
+    CONF_SIGNIFICANCE_THRESHOLD,
+    CONF_SIGNIFICANCE_WEIGHTS,
+    CONF_SIMILARITY_THRESHOLD,
+    CONF_WEATHER_ENTITY,
+    DEFAULT_LAZY_MAX_AGE,
+    DEFAULT_MAX_AGE,
+    DEFAULT_SIGNIFICANCE_THRESHOLD,
+    DEFAULT_SIGNIFICANCE_WEIGHTS,
+    CUSTOM_SUMMARY,
+    SUMMARY_MAX_LENGTH,
+    TEMPLATE_SUMMARY,
+    WEATHER_SUMMARY,
+)
+from .conversation import WeatherSummaryConversationEntity
+from .custom_summary import (
+    CONF_INTERVAL,
+    CONF_NAME,
+    CONF_PROMPT,
+    CONF_RATE_LIMIT,
+    CONF_REFRESH,
+    CUSTOM_SUMMARIES_SCHEMA,
+    RefreshPolicy,
+)
+from .engine import DATA_ENGINE
+from .forecast import async_get_compressed_forecast
+from .local_summary import async_area_entity_ids
+from .models import SummaryAgentData
+from .publisher import SummaryUpdate
+from .significance import (
+    AreaSignificance,
+    has_significant_change,
+    score_similarity,
+    score_state_change,
+)
+from .template_summary import TemplateSummary
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
 SCAN_INTERVAL = datetime.timedelta(minutes=15)
-PARALLEL_UPDATES = 1
-MAX_LENGTH = 255
+# Summary refreshes are limited per config entry by the engine
+PARALLEL_UPDATES = 0
 PLACEHOLDER = "..."
 
+ATTR_SIGNIFICANCE = "significance"
+ATTR_SIGNIFICANCE_REASON = "significance_reason"
+ATTR_STALE = "stale"
+ATTR_SIMILARITY = "similarity"
+ATTR_AGENT_ID = "agent_id"
+ATTR_DURATION = "duration"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,37 +98,125 @@ async def async_setup_entry(
 ) -> None:
     """Set up conversation entities."""
     area_registry: ar.AreaRegistry = ar.async_get(hass)
-    entities = []
-    for area_entry in area_registry.async_list_areas():
-        entities.append(AreaSummarySensorEntity(config_entry, area_entry))
+    area_entities = [
+        AreaSummarySensorEntity(config_entry, area_entry)
+        for area_entry in area_registry.async_list_areas()
+    ]
+    entities: list[RestoreSensor] = [*area_entities]
+    if weather_entity_id := config_entry.options.get(CONF_WEATHER_ENTITY):
+        entities.append(WeatherSummarySensorEntity(config_entry, weather_entity_id))
+    custom_entities = [
+        CustomSummarySensorEntity(config_entry, custom_summary)
+        for custom_summary in CUSTOM_SUMMARIES_SCHEMA(
+            config_entry.options.get(CONF_CUSTOM_SUMMARIES, [])
+        )
+    ]
+    entities.extend(custom_entities)
 
     async_add_entities(entities)
+    data: SummaryAgentData = hass.data[DOMAIN][config_entry.entry_id]
+    data.sensors.extend(area_entities)
 
+    scheduled: list[AreaSummarySensorEntity | CustomSummarySensorEntity] = [
+        *area_entities,
+        *custom_entities,
+    ]
 
-def get_area_summary_agent_id(hass: HomeAssistant, config_entry_id: str) -> str | None:
-    """Get the Area Summary agent id."""
+    async def async_update_summary(
+        entity: AreaSummarySensorEntity | CustomSummarySensorEntity,
+    ) -> None:
+        """Update a summary, isolating failures from the other summaries."""
+        try:
+            await entity.async_scheduled_update()
+        except Exception:
+            _LOGGER.exception("Unexpected error updating %s", entity.entity_id)
+            entity.async_set_stale()
+
+    async def async_update_summaries(now: datetime.datetime) -> None:
+        """Update the area and custom summaries together.
+
+        The refreshes in flight are limited by the engine to the number of
+        backing agents of the config entry.
+        """
+        await asyncio.gather(*(async_update_summary(entity) for entity in scheduled))
+
+    config_entry.async_on_unload(
+        async_track_time_interval(hass, async_update_summaries, SCAN_INTERVAL)
+    )
+
+
+def get_summary_agent_id(
+    hass: HomeAssistant, config_entry_id: str, unique_id: str
+) -> str | None:
+    """Get the id of a summary agent of the config entry."""
     entity_registry = er.async_get(hass)
     entries = er.async_entries_for_config_entry(
         entity_registry, config_entry_id
     )
     for entry in entries:
-        if entry.unique_id == AREA_SUMMARY:
+        if entry.unique_id == f"{config_entry_id}-{unique_id}":
             return entry.entity_id  # type: ignore[no-any-return]
     return None
 
 
+def get_area_summary_agent_id(hass: HomeAssistant, config_entry_id: str) -> str | None:
+    """Get the Area Summary agent id."""
+    return get_summary_agent_id(hass, config_entry_id, AREA_SUMMARY)
+
+
+def agent_available(hass: HomeAssistant, config_entry_id: str) -> bool:
+    """Return True if the circuit of any backing agent of the config entry is not open."""
+    data: SummaryAgentData = hass.data[DOMAIN][config_entry_id]
+    return data.pool.async_available()
+
+
+async def async_summarize(
+    hass: HomeAssistant, agent_id: str, text: str, context: Context | None = None
+) -> str:
+    """Ask a summary agent for a summary and return it shortened to fit a state."""
+    response = await hass.services.async_call(
+        "conversation",
+        "process",
+        {"agent_id": agent_id, "text": text},
+        blocking=True,
+        context=context,
+        return_response=True,
+    )
+    intent_response = cast(dict[str, Any], response.get("response", {}))  # type: ignore[union-attr]
+    value = cast(
+        str,
+        (intent_response.get("speech", {}).get("plain", {}).get("speech", "unknown")),
+    )
+    # The service response holds the serialized value of the response type
+    if intent_response.get("response_type") == intent.IntentResponseType.ERROR.value:
+        raise HomeAssistantError(value)
+    return textwrap.shorten(
+        value, width=SUMMARY_MAX_LENGTH, break_long_words=True, placeholder=PLACEHOLDER
+    )
+
+
 class AreaSummarySensorEntity(RestoreSensor):
     """An entity to represent an area summary as sensor value."""
 
     _attr_name = None
     _attr_has_entity_name = True
-    _attr_should_poll = True
+    # Updated on an interval by the platform, only writing changed states
+    _attr_should_poll = False
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:comment-text"
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_SIGNIFICANCE,
+            ATTR_SIGNIFICANCE_REASON,
+            ATTR_SIMILARITY,
+            ATTR_AGENT_ID,
+            ATTR_DURATION,
+        }
+    )
 
     def __init__(self, config_entry: ConfigEntry, area_entry: ar.AreaEntry) -> None:
         """Initialize AreaSummarySensorEntity."""
-        self._attr_unique_id = f"{AREA_SUMMARY}-{area_entry.id}"
+        self._attr_unique_id = f"{config_entry.entry_id}-{AREA_SUMMARY}-{area_entry.id}"
         self._attr_native_value: str | None = None
         self._attr_device_info = dr.DeviceInfo(
             identifiers={(DOMAIN, self._attr_unique_id)},
@@ -75,32 +226,565 @@ class AreaSummarySensorEntity(RestoreSensor):
         )
         self._config_entry = config_entry
         self._area_entry = area_entry
+        self._significance = AreaSignificance()
+        self._significance_threshold = float(
+            config_entry.options.get(
+                CONF_SIGNIFICANCE_THRESHOLD, DEFAULT_SIGNIFICANCE_THRESHOLD
+            )
+        )
+        self._significance_weights = config_entry.options.get(
+            CONF_SIGNIFICANCE_WEIGHTS, DEFAULT_SIGNIFICANCE_WEIGHTS
+        )
+        self._max_age = datetime.timedelta(
+            minutes=config_entry.options.get(CONF_MAX_AGE, DEFAULT_MAX_AGE)
+        )
+        self._similarity_threshold: float | None = config_entry.options.get(
+            CONF_SIMILARITY_THRESHOLD
+        )
+        self._lazy = config_entry.options.get(CONF_LAZY, False)
+        self._lazy_max_age = datetime.timedelta(
+            minutes=config_entry.options.get(CONF_LAZY_MAX_AGE, DEFAULT_LAZY_MAX_AGE)
+        )
+        self._last_summarized: datetime.datetime | None = None
+        # States of the area when it was last summarized
+        self._summarized_states: dict[str, State] = {}
+        self._similarity: float | None = None
+        self._agent_id: str | None = None
+        self._duration: float | None = None
+        self._restored_last_changed: datetime.datetime | None = None
+        self._stale = False
+        self._update_lock = asyncio.Lock()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the significance of changes since the last summary."""
+        return {
+            ATTR_SIGNIFICANCE: round(self._significance.score, 2),
+            ATTR_SIGNIFICANCE_REASON: self._significance.reason,
+            ATTR_STALE: self._stale,
+            ATTR_SIMILARITY: (
+                round(self._similarity, 2) if self._similarity is not None else None
+            ),
+            ATTR_AGENT_ID: self._agent_id,
+            ATTR_DURATION: (
+                round(self._duration, 3) if self._duration is not None else None
+            ),
+        }
+
+    @callback
+    def async_tuning(self) -> dict[str, Any]:
+        """Return the live significance and similarity of the area for tuning.
+
+        The state is only written when the summary changes, so the attributes
+        do not follow the changes that accumulate between summaries.
+        """
+        similarity = None
+        if self._last_summarized is not None:
+            similarity = score_similarity(
+                self._significance_weights,
+                self._summarized_states,
+                self._async_area_states(),
+            )
+        return {
+            "area_id": self._area_entry.id,
+            ATTR_SIGNIFICANCE: round(self._significance.score, 2),
+            ATTR_SIGNIFICANCE_REASON: self._significance.reason,
+            ATTR_SIMILARITY: round(similarity, 2) if similarity is not None else None,
+            "last_summarized": (
+                self._last_summarized.isoformat() if self._last_summarized else None
+            ),
+        }
+
+    @callback
+    def _async_area_states(self) -> dict[str, State]:
+        """Return the current states of the entities in the area."""
+        return {
+            entity_id: state
+            for entity_id in async_area_entity_ids(self.hass, self._area_entry.id)
+            if (state := self.hass.states.get(entity_id)) is not None
+        }
+
+    def _needs_summary(self) -> bool:
+        """Return True if the area has changed enough to regenerate the summary."""
+        if self._attr_native_value is None:
+            return True
+        if self._lazy and not self.hass.data[DATA_ENGINE].demand.async_in_use(
+            self._area_entry.id, self.entity_id
+        ):
+            # Areas nobody is using keep their cached summary for longer
+            last_summarized = self._last_summarized or self._restored_last_changed
+            return (
+                last_summarized is None
+                or dt_util.utcnow() - last_summarized >= self._lazy_max_age
+            )
+        if self._last_summarized is None:
+            return True
+        if self._significance.score >= self._significance_threshold:
+            return True
+        return dt_util.utcnow() - self._last_summarized >= self._max_age
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Accumulate the significance of a state change in the area."""
+        new_state = event.data["new_state"]
+        score = score_state_change(
+            self._significance_weights, event.data["old_state"], new_state
+        )
+        self._significance.add(
+            event.data["entity_id"],
+            new_state.state if new_state is not None else "removed",
+            score,
+        )
 
     async def async_update(self) -> None:
         """Update the entity."""
+        if not self._needs_summary():
+            _LOGGER.debug(
+                "Skipping summary for %s with significance %s",
+                self._area_entry.name,
+                self._significance.score,
+            )
+            return
+
         if (area_summary_agent_id := get_area_summary_agent_id(self.hass, self._config_entry.entry_id)) is None:
             _LOGGER.warning("Area Summary Agent could not be found for config entry %s", self._config_entry.entry_id)
             self._attr_available = False
             return
         self._attr_available = True
 
-        response = await self.hass.services.async_call(
-            "conversation",
-            "process",
-            {"agent_id": area_summary_agent_id, "text": self._area_entry.name},
-            blocking=True,
-            return_response=True,
-        )
-        value = cast(str, (
-            response.get("response", {})  # type: ignore[union-attr]
-            .get("speech", {})
-            .get("plain", {})
-            .get("speech", "unknown")
-        ))
-        self._attr_native_value = textwrap.shorten(value, width=MAX_LENGTH, break_long_words=True, placeholder=PLACEHOLDER)
+        area_states = self._async_area_states()
+        if self._last_summarized is not None:
+            self._similarity = score_similarity(
+                self._significance_weights, self._summarized_states, area_states
+            )
+            if (
+                self._similarity_threshold is not None
+                and self._similarity >= self._similarity_threshold
+                and not has_significant_change(
+                    self._significance_weights,
+                    self._summarized_states,
+                    area_states,
+                    self._significance_threshold,
+                )
+            ):
+                _LOGGER.debug(
+                    "Reusing summary for %s with similarity %s",
+                    self._area_entry.name,
+                    self._similarity,
+                )
+                return
+
+        if self._attr_native_value is not None and not agent_available(
+            self.hass, self._config_entry.entry_id
+        ):
+            _LOGGER.debug(
+                "Backing agent unavailable, keeping last summary for %s",
+                self._area_entry.name,
+            )
+            self._stale = True
+            return
+        engine = self.hass.data[DATA_ENGINE]
+        start = time.monotonic()
+        try:
+            with engine.demand.internal_request() as context:
+                self._attr_native_value = await engine.async_refresh(
+                    self._config_entry.entry_id,
+                    partial(
+                        async_summarize,
+                        self.hass,
+                        area_summary_agent_id,
+                        self._area_entry.name,
+                        context,
+                    ),
+                )
+        except HomeAssistantError as err:
+            _LOGGER.warning(
+                "Error summarizing %s, keeping last summary: %s",
+                self._area_entry.name,
+                err,
+            )
+            self._stale = True
+            return
+        self._stale = False
+        self._agent_id = area_summary_agent_id
+        self._duration = time.monotonic() - start
+        self._last_summarized = dt_util.utcnow()
+        self._summarized_states = area_states
+        self._similarity = None
+        self._significance.reset()
+        self._async_publish()
+        self._async_record_history()
+
+    def _recorded_state(self) -> tuple[Any, ...]:
+        """Return the parts of the state that are written to the recorder."""
+        return (self._attr_native_value, self._attr_available, self._stale)
+
+    async def async_scheduled_update(self) -> None:
+        """Update the entity, only writing the state when the summary changed.
+
+        Writing the state for every update would record a new row whenever the
+        tuning attributes change, even when the summary is the same.
+        """
+        if self._update_lock.locked():
+            _LOGGER.debug(
+                "Previous update of %s is still running", self._area_entry.name
+            )
+            return
+        async with self._update_lock:
+            previous = self._recorded_state()
+            await self.async_update()
+            if self._recorded_state() != previous:
+                self.async_write_ha_state()
+
+    @callback
+    def async_set_stale(self) -> None:
+        """Mark the summary as stale when it could not be refreshed."""
+        if not self._stale:
+            self._stale = True
+            self.async_write_ha_state()
+
+    @callback
+    def _async_record_history(self) -> None:
+        """Record the summary in the stored history when enabled."""
+        data: SummaryAgentData = self.hass.data[DOMAIN][self._config_entry.entry_id]
+        if data.history is not None and self._attr_native_value is not None:
+            data.history.async_record(
+                self.entity_id,
+                self._attr_native_value,
+                self._last_summarized or dt_util.utcnow(),
+            )
+
+    @callback
+    def _async_publish(self, notify: bool = True) -> None:
+        """Publish the current summary to event and websocket subscribers."""
+        if self._attr_native_value is None:
+            return
+        self.hass.data[DATA_ENGINE].publisher.async_publish(
+            SummaryUpdate(
+                entity_id=self.entity_id,
+                area_id=self._area_entry.id,
+                area_name=self._area_entry.name,
+                summary=self._attr_native_value,
+                last_updated=self._last_summarized or dt_util.utcnow(),
+            ),
+            notify=notify,
+        )
 
     async def async_added_to_hass(self) -> None:
         """Add the entity and restore values."""
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.hass.data[DATA_ENGINE].areas.async_listen(
+                self._area_entry.id, self._async_state_changed
+            )
+        )
         if (last_sensor_state := await self.async_get_last_sensor_data()):
             self._attr_native_value = cast(str, last_sensor_state.native_value)
+            self._async_publish(notify=False)
+        if last_state := await self.async_get_last_state():
+            self._restored_last_changed = last_state.last_changed
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop publishing the summary of the area."""
+        self.hass.data[DATA_ENGINE].publisher.async_remove(self.entity_id)
+
+
+@dataclass
+class CustomSummaryExtraStoredData(SensorExtraStoredData):
+    """The restored summary and the prompt it was made from."""
+
+    prompt: str | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the custom summary data."""
+        return {**super().as_dict(), "prompt": self.prompt}
+
+    @classmethod
+    def from_dict(
+        cls, restored: dict[str, Any]
+    ) -> "CustomSummaryExtraStoredData | None":
+        """Initialize a stored custom summary from a dict."""
+        if (data := SensorExtraStoredData.from_dict(restored)) is None:
+            return None
+        return cls(
+            data.native_value, data.native_unit_of_measurement, restored.get("prompt")
+        )
+
+
+class CustomSummarySensorEntity(RestoreSensor):
+    """An entity to represent the summary of a prompt template from the options."""
+
+    _attr_name = None
+    _attr_has_entity_name = True
+    # Updated by the template or on an interval by the platform
+    _attr_should_poll = False
+    _attr_icon = "mdi:comment-text"
+    _unrecorded_attributes = frozenset({ATTR_AGENT_ID, ATTR_DURATION})
+
+    def __init__(
+        self, config_entry: ConfigEntry, custom_summary: dict[str, Any]
+    ) -> None:
+        """Initialize CustomSummarySensorEntity."""
+        name: str = custom_summary[CONF_NAME]
+        self._attr_unique_id = (
+            f"{config_entry.entry_id}-{CUSTOM_SUMMARY}-{slugify(name)}"
+        )
+        self._attr_native_value: str | None = None
+        self._attr_device_info = dr.DeviceInfo(
+            identifiers={(DOMAIN, self._attr_unique_id)},
+            name=name,
+            entry_type=dr.DeviceEntryType.SERVICE,
+        )
+        self._config_entry = config_entry
+        self._template: str = custom_summary[CONF_PROMPT].template
+        self._refresh = RefreshPolicy(custom_summary[CONF_REFRESH])
+        self._interval = datetime.timedelta(minutes=custom_summary[CONF_INTERVAL])
+        self._rate_limit = datetime.timedelta(minutes=custom_summary[CONF_RATE_LIMIT])
+        self._prompt: str | None = None
+        self._last_summarized: datetime.datetime | None = None
+        self._agent_id: str | None = None
+        self._duration: float | None = None
+        self._stale = False
+        self._update_lock = asyncio.Lock()
+        self._template_summary: TemplateSummary | None = None
+
+    @property
+    def extra_restore_state_data(self) -> CustomSummaryExtraStoredData:
+        """Return the summary and its prompt so it is not summarized again on restart."""
+        return CustomSummaryExtraStoredData(
+            self.native_value, self.native_unit_of_measurement, self._prompt
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return details of the last summary."""
+        return {
+            ATTR_STALE: self._stale,
+            ATTR_AGENT_ID: self._agent_id,
+            ATTR_DURATION: (
+                round(self._duration, 3) if self._duration is not None else None
+            ),
+        }
+
+    async def _async_summarize(self, template_str: str, prompt: str) -> str | None:
+        """Ask the Template agent for a summary of the template.
+
+        Requests share the concurrency limit of the area summaries and use the
+        backing agent pool of the config entry.
+        """
+        if (
+            agent_id := get_summary_agent_id(
+                self.hass, self._config_entry.entry_id, TEMPLATE_SUMMARY
+            )
+        ) is None:
+            _LOGGER.warning(
+                "Template Agent could not be found for config entry %s",
+                self._config_entry.entry_id,
+            )
+            return None
+        if self._attr_native_value is not None and not agent_available(
+            self.hass, self._config_entry.entry_id
+        ):
+            _LOGGER.debug(
+                "Backing agent unavailable, keeping last summary for %s", self.entity_id
+            )
+            self.async_set_stale()
+            return None
+        start = time.monotonic()
+        try:
+            summary = await self.hass.data[DATA_ENGINE].async_refresh(
+                self._config_entry.entry_id,
+                partial(async_summarize, self.hass, agent_id, template_str),
+            )
+        except HomeAssistantError:
+            self.async_set_stale()
+            raise
+        self._agent_id = agent_id
+        self._duration = time.monotonic() - start
+        return summary
+
+    @callback
+    def async_set_stale(self) -> None:
+        """Mark the summary as stale when it could not be refreshed."""
+        if not self._stale:
+            self._stale = True
+            self.async_write_ha_state()
+
+    @callback
+    def _async_summary_updated(self, summary: str) -> None:
+        """Write a new summary to the state."""
+        if self._template_summary is not None:
+            self._prompt = self._template_summary.summarized_prompt
+        self._attr_native_value = summary
+        self._stale = False
+        self._last_summarized = dt_util.utcnow()
+        self.async_write_ha_state()
+        data: SummaryAgentData = self.hass.data[DOMAIN][self._config_entry.entry_id]
+        if data.history is not None:
+            data.history.async_record(self.entity_id, summary, self._last_summarized)
+
+    async def async_scheduled_update(self) -> None:
+        """Refresh an interval summary when it is due and the prompt changed.
+
+        Summaries following the template retry a prompt that failed to be
+        summarized.
+        """
+        if self._refresh == RefreshPolicy.CHANGE:
+            if self._template_summary is not None:
+                await self._template_summary.async_retry()
+            return
+        if self._update_lock.locked():
+            return
+        if (
+            self._last_summarized is not None
+            and dt_util.utcnow() - self._last_summarized < self._interval
+        ):
+            return
+        async with self._update_lock:
+            try:
+                prompt = str(
+                    template.Template(self._template, self.hass).async_render(
+                        parse_result=False
+                    )
+                )
+            except TemplateError as err:
+                _LOGGER.error(
+                    "Error rendering custom summary %s: %s", self.entity_id, err
+                )
+                return
+            if prompt == self._prompt and self._attr_native_value is not None:
+                _LOGGER.debug(
+                    "Skipping summary for unchanged prompt of %s", self.entity_id
+                )
+                return
+            try:
+                summary = await self._async_summarize(self._template, prompt)
+            except HomeAssistantError as err:
+                _LOGGER.warning(
+                    "Error summarizing %s, keeping last summary: %s",
+                    self.entity_id,
+                    err,
+                )
+                return
+            if summary is not None:
+                self._prompt = prompt
+                self._async_summary_updated(summary)
+
+    async def async_added_to_hass(self) -> None:
+        """Add the entity, restore values and follow the template."""
+        await super().async_added_to_hass()
+        if (
+            (last_extra_data := await self.async_get_last_extra_data())
+            and (
+                restored := CustomSummaryExtraStoredData.from_dict(
+                    last_extra_data.as_dict()
+                )
+            )
+            and restored.native_value is not None
+        ):
+            self._attr_native_value = cast(str, restored.native_value)
+            self._prompt = restored.prompt
+        if self._refresh == RefreshPolicy.CHANGE:
+            self._template_summary = TemplateSummary(
+                self.hass,
+                self._template,
+                self._async_summarize,
+                self._async_summary_updated,
+                summarized_prompt=self._prompt,
+                summary=self._attr_native_value,
+                rate_limit=self._rate_limit,
+            )
+            self.async_on_remove(self._template_summary.async_start())
+
+
+class WeatherSummarySensorEntity(RestoreSensor):
+    """An entity to represent a weather forecast summary as sensor value."""
+
+    _attr_name = None
+    _attr_has_entity_name = True
+    _attr_should_poll = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:weather-partly-cloudy"
+
+    def __init__(self, config_entry: ConfigEntry, weather_entity_id: str) -> None:
+        """Initialize WeatherSummarySensorEntity."""
+        self._attr_unique_id = (
+            f"{config_entry.entry_id}-{WEATHER_SUMMARY}-{weather_entity_id}"
+        )
+        self._attr_native_value: str | None = None
+        self._attr_device_info = dr.DeviceInfo(
+            identifiers={(DOMAIN, self._attr_unique_id)},
+            name="Weather Summary",
+            entry_type=dr.DeviceEntryType.SERVICE,
+        )
+        self._config_entry = config_entry
+        self._weather_entity_id = weather_entity_id
+        self._forecast: str | None = None
+        self._stale = False
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the summary could not be refreshed."""
+        return {ATTR_STALE: self._stale}
+
+    async def async_update(self) -> None:
+        """Update the entity when the compressed forecast has changed."""
+        try:
+            forecast = await async_get_compressed_forecast(
+                self.hass, self._weather_entity_id
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning(
+                "Unable to get the forecast for %s: %s", self._weather_entity_id, err
+            )
+            self._attr_available = False
+            return
+        self._attr_available = True
+        if forecast == self._forecast and self._attr_native_value is not None:
+            _LOGGER.debug(
+                "Skipping summary for unchanged forecast of %s", self._weather_entity_id
+            )
+            return
+
+        if (
+            agent_id := get_summary_agent_id(
+                self.hass, self._config_entry.entry_id, WEATHER_SUMMARY
+            )
+        ) is None:
+            _LOGGER.warning(
+                "Weather Summary Agent could not be found for config entry %s",
+                self._config_entry.entry_id,
+            )
+            self._attr_available = False
+            return
+
+        if self._attr_native_value is not None and not agent_available(
+            self.hass, self._config_entry.entry_id
+        ):
+            _LOGGER.debug("Backing agent unavailable, keeping last weather summary")
+            self._stale = True
+            return
+        # The agent summarizes the forecast fetched above instead of fetching it again
+        data: SummaryAgentData = self.hass.data[DOMAIN][self._config_entry.entry_id]
+        for agent in data.agents:
+            if isinstance(agent, WeatherSummaryConversationEntity):
+                agent.async_provide_forecast(self._weather_entity_id, forecast)
+        try:
+            self._attr_native_value = await self.hass.data[DATA_ENGINE].async_refresh(
+                self._config_entry.entry_id,
+                partial(async_summarize, self.hass, agent_id, self._weather_entity_id),
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning(
+                "Error summarizing the weather, keeping last summary: %s", err
+            )
+            self._stale = True
+            return
+        self._stale = False
+        self._forecast = forecast
+
+    async def async_added_to_hass(self) -> None:
+        """Add the entity and restore values."""
+        await super().async_added_to_hass()
+        if last_sensor_state := await self.async_get_last_sensor_data():
+            self._attr_native_value = cast(str, last_sensor_state.native_value)
@@ -0,0 +1,180 @@
+"""Scoring of state changes to decide when an area summary is stale.
+
+Each state change in an area is given a score based on weights for the domain,
+device class and the state being transitioned to. The area summary is only
+regenerated once the accumulated score crosses a threshold.
+
+The same weights are used to compare the states of an area to the states when
+it was last summarized, so that a summary can be reused when only a few
+insignificant entities differ.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+import math
+from typing import cast
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_CLASS
+from homeassistant.core import State
+from homeassistant.helpers import config_validation as cv
+
+# Sections of the weights configuration
+DOMAIN_WEIGHTS = "domain"
+DEVICE_CLASS_WEIGHTS = "device_class"
+TRANSITION_WEIGHTS = "transition"
+
+_SECTION_SCHEMA = vol.Schema({cv.string: vol.All(vol.Coerce(float), vol.Range(min=0))})
+WEIGHTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN_WEIGHTS): _SECTION_SCHEMA,
+        vol.Optional(DEVICE_CLASS_WEIGHTS): _SECTION_SCHEMA,
+        vol.Optional(TRANSITION_WEIGHTS): _SECTION_SCHEMA,
+    }
+)
+
+DEFAULT_WEIGHT = 1.0
+MAX_REASONS = 3
+
+
+@dataclass
+class SignificanceContribution:
+    """A single scored state change."""
+
+    entity_id: str
+    to_state: str
+    score: float
+
+    def __str__(self) -> str:
+        """Return a human readable description of the contribution."""
+        return f"{self.entity_id} {self.to_state} (+{self.score:g})"
+
+
+def state_weight(weights: Mapping[str, Mapping[str, float]], state: State) -> float:
+    """Return the weight of an entity by its device class or domain."""
+    device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+    if (
+        device_class is None
+        or (weight := weights.get(DEVICE_CLASS_WEIGHTS, {}).get(device_class)) is None
+    ) and (weight := weights.get(DOMAIN_WEIGHTS, {}).get(state.domain)) is None:
+        weight = DEFAULT_WEIGHT
+    return float(weight)
+
+
+def score_state_change(
+    weights: Mapping[str, Mapping[str, float]],
+    old_state: State | None,
+    new_state: State | None,
+) -> float:
+    """Return the significance score of a single state change.
+
+    Transition weights are keyed by `<domain>.<new state>` and take precedence
+    over device class weights which take precedence over domain weights. Changes
+    between two numeric values are scaled by their relative change so that small
+    drift in a sensor reading is insignificant.
+    """
+    if new_state is None or old_state is None:
+        return DEFAULT_WEIGHT
+    if old_state.state == new_state.state:
+        return 0.0
+    transition = f"{new_state.domain}.{new_state.state}"
+    if (weight := weights.get(TRANSITION_WEIGHTS, {}).get(transition)) is not None:
+        return float(weight)
+    weight = state_weight(weights, new_state)
+    try:
+        old_value = float(old_state.state)
+        new_value = float(new_state.state)
+    except ValueError:
+        return weight
+    if not math.isfinite(old_value) or not math.isfinite(new_value):
+        return weight
+    relative_change = abs(new_value - old_value) / max(abs(old_value), 1.0)
+    return weight * min(1.0, relative_change)
+
+
+def score_similarity(
+    weights: Mapping[str, Mapping[str, float]],
+    old_states: Mapping[str, State],
+    new_states: Mapping[str, State],
+) -> float:
+    """Return the similarity of two snapshots of the states of an area.
+
+    Each entity counts by its weight and the similarity is the fraction of the
+    total weight that did not change, where a changed entity counts by the
+    score of the change. Added or removed entities count as fully changed.
+    """
+    total = 0.0
+    changed = 0.0
+    for entity_id in old_states.keys() | new_states.keys():
+        old_state = old_states.get(entity_id)
+        new_state = new_states.get(entity_id)
+        weight = state_weight(weights, cast(State, new_state or old_state))
+        score = score_state_change(weights, old_state, new_state)
+        if old_state is None or new_state is None:
+            score = weight
+        total += max(weight, score)
+        changed += score
+    if not total:
+        return 1.0
+    return 1.0 - changed / total
+
+
+def has_significant_change(
+    weights: Mapping[str, Mapping[str, float]],
+    old_states: Mapping[str, State],
+    new_states: Mapping[str, State],
+    threshold: float,
+) -> bool:
+    """Return True if any single entity changed significantly between snapshots.
+
+    A change is significant on its own if it reaches the threshold or matches
+    a transition weight, however similar the rest of the area stayed.
+    """
+    transitions = weights.get(TRANSITION_WEIGHTS, {})
+    for entity_id in old_states.keys() | new_states.keys():
+        old_state = old_states.get(entity_id)
+        new_state = new_states.get(entity_id)
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            continue
+        if (
+            new_state is not None
+            and f"{new_state.domain}.{new_state.state}" in transitions
+        ):
+            return True
+        if score_state_change(weights, old_state, new_state) >= threshold:
+            return True
+    return False
+
+
+@dataclass
+class AreaSignificance:
+    """Accumulated significance of the changes in an area since the last summary."""
+
+    score: float = 0.0
+    contributions: list[SignificanceContribution] = field(default_factory=list)
+
+    def add(self, entity_id: str, to_state: str, score: float) -> None:
+        """Record a scored state change."""
+        if score <= 0:
+            return
+        self.score += score
+        self.contributions.append(SignificanceContribution(entity_id, to_state, score))
+        self.contributions.sort(key=lambda c: c.score, reverse=True)
+        del self.contributions[MAX_REASONS:]
+
+    @property
+    def reason(self) -> str | None:
+        """Return a description of the most significant changes."""
+        if not self.contributions:
+            return None
+        return ", ".join(str(contribution) for contribution in self.contributions)
+
+    def reset(self) -> None:
+        """Reset the accumulated score after the area has been summarized."""
+        self.score = 0.0
+        self.contributions.clear()
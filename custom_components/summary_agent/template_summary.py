@@ -0,0 +1,169 @@
+"""Template summaries that are refreshed when the inputs of the template change.
+
+The entities, areas and other state read by a template are captured while it
+is rendered. The template is rendered again only when one of them changes and
+the backing agent is only asked for a new summary when the rendered prompt is
+different from the last one that was summarized, at most once per rate limit.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError, TemplateError
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    TrackTemplateResult,
+    async_call_later,
+    async_track_template_result,
+)
+from homeassistant.helpers.template import Template
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TemplateSummary:
+    """A summary of a template kept up to date with its dependencies."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        template: str,
+        summarize: Callable[[str, str], Awaitable[str | None]],
+        update_callback: Callable[[str], None],
+        summarized_prompt: str | None = None,
+        summary: str | None = None,
+        rate_limit: datetime.timedelta | None = None,
+    ) -> None:
+        """Initialize TemplateSummary.
+
+        The summarize function is called with the template and the rendered
+        prompt and returns the new summary, or None when it failed. A summary
+        restored with the prompt it was made from is kept until the prompt
+        changes. A prompt that changes within the rate limit of the last summary
+        is summarized once the rate limit has passed.
+        """
+        self._hass = hass
+        self._template = template
+        self._summarize = summarize
+        self._update_callback = update_callback
+        self._rate_limit = rate_limit
+        self._last_attempt: datetime.datetime | None = None
+        self._unsub_rate_limit: CALLBACK_TYPE | None = None
+        self._lock = asyncio.Lock()
+        self.prompt: str | None = None
+        self.summarized_prompt = summarized_prompt
+        self.summary = summary
+        self.renders = 0
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start tracking the template, returning a callback to stop."""
+        info = async_track_template_result(
+            self._hass,
+            [TrackTemplate(Template(self._template, self._hass), None)],
+            self._async_template_changed,
+        )
+        info.async_refresh()
+
+        @callback
+        def async_stop() -> None:
+            info.async_remove()
+            if self._unsub_rate_limit is not None:
+                self._unsub_rate_limit()
+                self._unsub_rate_limit = None
+
+        return async_stop
+
+    @callback
+    def _async_template_changed(
+        self, event: Event[Any] | None, updates: list[TrackTemplateResult]
+    ) -> None:
+        """Request a new summary when the rendered prompt changed."""
+        self.renders += 1
+        result = updates.pop().result
+        if isinstance(result, TemplateError):
+            _LOGGER.error("Error rendering template summary: %s", result)
+            return
+        self.prompt = str(result)
+        if self.prompt == self.summarized_prompt:
+            return
+        self._async_schedule_update(self.prompt)
+
+    @callback
+    def _async_rate_limit_delay(self) -> datetime.timedelta | None:
+        """Return how long until the rate limit of the last attempt has passed."""
+        if self._rate_limit is None or self._last_attempt is None:
+            return None
+        delay = self._last_attempt + self._rate_limit - dt_util.utcnow()
+        return delay if delay > datetime.timedelta(0) else None
+
+    @callback
+    def _async_schedule_update(self, prompt: str) -> None:
+        """Summarize the prompt now or once the rate limit has passed."""
+        # A pending update summarizes the latest prompt when it runs
+        if self._unsub_rate_limit is not None:
+            return
+        if (delay := self._async_rate_limit_delay()) is not None:
+            self._unsub_rate_limit = async_call_later(
+                self._hass, delay, self._async_rate_limit_passed
+            )
+            return
+        self._async_create_update(prompt)
+
+    @callback
+    def _async_rate_limit_passed(self, now: datetime.datetime) -> None:
+        """Summarize a prompt that changed within the rate limit."""
+        self._unsub_rate_limit = None
+        if self.prompt is not None and self.prompt != self.summarized_prompt:
+            self._async_create_update(self.prompt)
+
+    @callback
+    def _async_create_update(self, prompt: str) -> None:
+        """Summarize the prompt in the background."""
+        self._hass.async_create_background_task(
+            self._async_update(prompt), "summary_agent template summary"
+        )
+
+    async def async_retry(self) -> None:
+        """Summarize the current prompt again if the last attempt failed."""
+        if (
+            self.prompt is not None
+            and self._unsub_rate_limit is None
+            and self._async_rate_limit_delay() is None
+        ):
+            await self._async_update(self.prompt)
+
+    async def _async_update(self, prompt: str) -> None:
+        """Summarize the prompt unless it was replaced or already summarized."""
+        async with self._lock:
+            if prompt != self.prompt or prompt == self.summarized_prompt:
+                return
+            self._last_attempt = dt_util.utcnow()
+            try:
+                summary = await self._summarize(self._template, prompt)
+            except HomeAssistantError as err:
+                _LOGGER.warning("Error updating template summary: %s", err)
+                return
+            # A failed prompt is retried on the next render or retry
+            if summary is None:
+                return
+            self.summarized_prompt = prompt
+        if summary == self.summary:
+            return
+        self.summary = summary
+        self._update_callback(summary)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a serializable dictionary of the template summary."""
+        return {
+            "template": self._template,
+            "prompt": self.prompt,
+            "summarized_prompt": self.summarized_prompt,
+            "summary": self.summary,
+            "renders": self.renders,
+        }
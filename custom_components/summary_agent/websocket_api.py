@@ -0,0 +1,136 @@
+"""Websocket API for subscribing to summary updates."""
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+from .conversation import TemplateConversationEntity
+from .engine import DATA_ENGINE
+from .models import SummaryAgentData
+from .publisher import SummaryUpdate
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_subscribe_template)
+    websocket_api.async_register_command(hass, websocket_history)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "summary_agent/subscribe",
+        vol.Optional("area_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the current summaries and then every new summary."""
+    engine = hass.data[DATA_ENGINE]
+    area_id = msg.get("area_id")
+
+    @callback
+    def async_forward(update: SummaryUpdate) -> None:
+        if area_id is not None and update.area_id != area_id:
+            return
+        connection.send_message(
+            websocket_api.event_message(msg["id"], update.as_dict())
+        )
+
+    unsubs = [
+        engine.publisher.async_subscribe(async_forward),
+        engine.demand.async_watch(area_id),
+    ]
+
+    @callback
+    def async_unsubscribe() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+    for update in engine.publisher.summaries:
+        async_forward(update)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "summary_agent/subscribe_template",
+        vol.Required("template"): str,
+        vol.Optional("agent_id"): str,
+    }
+)
+@websocket_api.require_admin
+@callback
+def websocket_subscribe_template(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Summarize a template each time its rendered prompt changes."""
+    data: dict[str, SummaryAgentData] = hass.data.get(DOMAIN, {})
+    agents = [
+        agent
+        for entry_data in data.values()
+        for agent in entry_data.agents
+        if isinstance(agent, TemplateConversationEntity)
+        and msg.get("agent_id", agent.entity_id) == agent.entity_id
+    ]
+    if not agents:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Template agent not found"
+        )
+        return
+
+    @callback
+    def async_forward(summary: str) -> None:
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"summary": summary})
+        )
+
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = agents[0].async_register_summary(
+        msg["template"], async_forward
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "summary_agent/history",
+        vol.Required("entity_id"): str,
+    }
+)
+@callback
+def websocket_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the stored history of a summary sensor."""
+    entity_registry = er.async_get(hass)
+    data: dict[str, SummaryAgentData] = hass.data.get(DOMAIN, {})
+    if (
+        (entry := entity_registry.async_get(msg["entity_id"])) is None
+        or entry.config_entry_id is None
+        or (entry_data := data.get(entry.config_entry_id)) is None
+        or entry_data.history is None
+    ):
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            "Summary history is not enabled for the entity",
+        )
+        return
+    connection.send_result(
+        msg["id"], {"history": entry_data.history.as_list(msg["entity_id"])}
+    )
@@ -1,8 +1,10 @@
 """Fixtures for Summary Agent integration."""
 
+import asyncio
+import random
 import uuid
 from typing import Literal
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 import logging
 from functools import partial
 from unittest.mock import patch
@@ -13,8 +15,14 @@ from homeassistant.const import Platform, MATCH_ALL
 from homeassistant.components import conversation
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
-from homeassistant.helpers import device_registry as dr, intent, area_registry as ar
+from homeassistant.helpers import (
+    area_registry as ar,
+    chat_session,
+    device_registry as dr,
+    intent,
+)
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
@@ -224,6 +232,116 @@ class FakeAgent(conversation.ConversationEntity):
         return
 
 
+class StreamingAgent(FakeAgent):
+    """Fake agent that streams its response into the chat log a word at a time."""
+
+    def __init__(self, entity_id: str) -> None:
+        """Initialize StreamingAgent."""
+        super().__init__(entity_id)
+        self.deltas = 0
+
+    async def async_process(
+        self, user_input: conversation.ConversationInput
+    ) -> conversation.ConversationResult:
+        """Process a sentence by streaming the response."""
+        self.conversations.append(user_input.text)
+        response = self.responses.pop() if self.responses else "No response"
+
+        async def stream() -> AsyncGenerator[conversation.AssistantContentDeltaDict]:
+            yield {"role": "assistant"}
+            for word in response.split(" "):
+                self.deltas += 1
+                yield {"content": f"{word} "}
+                await asyncio.sleep(0)
+
+        with (
+            chat_session.async_get_chat_session(
+                self.hass, user_input.conversation_id
+            ) as session,
+            conversation.async_get_chat_log(self.hass, session, user_input) as chat_log,
+        ):
+            async for _ in chat_log.async_add_delta_content_stream(
+                self.entity_id, stream()
+            ):
+                pass
+            content = chat_log.content[-1]
+            assert isinstance(content, conversation.AssistantContent)
+
+        intent_response = intent.IntentResponse(language=user_input.language)
+        intent_response.async_set_speech((content.content or "").strip())
+        return conversation.ConversationResult(
+            response=intent_response,
+            conversation_id=session.conversation_id,
+        )
+
+
+class SimulatedAgent(FakeAgent):
+    """Fake agent that simulates a slow and flaky local LLM server.
+
+    Latency is drawn from a log-normal distribution around `latency` seconds. A
+    fraction of requests fail with an error or hang until cancelled by the
+    caller's timeout. At most `max_concurrency` requests are processed at once
+    and the rest wait in a queue.
+    """
+
+    def __init__(
+        self,
+        entity_id: str,
+        latency: float = 0.01,
+        jitter: float = 0.5,
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        max_concurrency: int = 1,
+        seed: int = 0,
+    ) -> None:
+        """Initialize SimulatedAgent."""
+        super().__init__(entity_id)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.max_concurrency = max_concurrency
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.errors = 0
+        self.timeouts = 0
+        self._rng = random.Random(seed)
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def async_process(
+        self, user_input: conversation.ConversationInput
+    ) -> conversation.ConversationResult:
+        """Process a sentence with simulated latency and failures."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        queued = True
+        try:
+            async with self._semaphore:
+                self.queue_depth -= 1
+                queued = False
+                self.conversations.append(user_input.text)
+                if self._rng.random() < self.timeout_rate:
+                    self.timeouts += 1
+                    await asyncio.Event().wait()
+                await asyncio.sleep(
+                    self.latency * self._rng.lognormvariate(0, self.jitter)
+                )
+                if self._rng.random() < self.error_rate:
+                    self.errors += 1
+                    raise HomeAssistantError("Simulated agent error")
+        finally:
+            if queued:
+                self.queue_depth -= 1
+        intent_response = intent.IntentResponse(language=user_input.language)
+        intent_response.async_set_speech(f"Summary {len(self.conversations)}")
+        return conversation.ConversationResult(
+            response=intent_response,
+            conversation_id=user_input.conversation_id,
+        )
+
+
 class FakeTempSensor(SensorEntity):
     """Fake agent."""
 
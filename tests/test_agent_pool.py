@@ -0,0 +1,233 @@
+"""Tests for load balancing across backing conversation agents."""
+
+import asyncio
+import datetime
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.summary_agent.agent_pool import (
+    AgentPool,
+    LoadBalancingStrategy,
+)
+from custom_components.summary_agent.const import DOMAIN
+from custom_components.summary_agent.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .conftest import FakeAgent, TEST_AGENT
+
+OTHER_AGENT = "conversation.other_agent"
+
+
+@pytest.fixture(name="config_entry")
+def mock_config_entry() -> MockConfigEntry:
+    """Fixture for a config entry with a pool of agents."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        options={
+            "agent_id": TEST_AGENT,
+            "agent_pool": [OTHER_AGENT],
+            "load_balancing": "round_robin",
+        },
+    )
+
+
+async def async_process(hass: HomeAssistant, text: str) -> str:
+    """Call the template agent and return the speech response."""
+    response = await hass.services.async_call(
+        "conversation",
+        "process",
+        {"agent_id": "conversation.template", "text": text},
+        blocking=True,
+        return_response=True,
+    )
+    assert response
+    return str(response["response"]["speech"]["plain"]["speech"])
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [{"conversation": [FakeAgent(TEST_AGENT), FakeAgent(OTHER_AGENT)]}],
+)
+async def test_round_robin(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Test requests are spread across the agents in the pool."""
+    agent, other_agent = mock_entities["conversation"]
+
+    for i in range(4):
+        await async_process(hass, f"Request {i}")
+
+    assert agent.conversations == ["Request 0", "Request 2"]
+    assert other_agent.conversations == ["Request 1", "Request 3"]
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [{"conversation": [FakeAgent(TEST_AGENT), FakeAgent(OTHER_AGENT)]}],
+)
+async def test_unhealthy_agent_removed(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Test that a failing agent is removed from rotation."""
+    agent, other_agent = mock_entities["conversation"]
+
+    with patch.object(
+        agent, "async_process", side_effect=HomeAssistantError("Server error")
+    ) as mock_process:
+        for i in range(10):
+            await async_process(hass, f"Request {i}")
+
+    assert len(mock_process.mock_calls) == 3
+    assert len(other_agent.conversations) == 7
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert diagnostics["pool"]["strategy"] == "round_robin"
+    agent_stats, other_agent_stats = diagnostics["pool"]["agents"]
+    assert agent_stats["agent_id"] == TEST_AGENT
+    assert not agent_stats["healthy"]
+    assert agent_stats["errors"] == 3
+    assert other_agent_stats["healthy"]
+    assert other_agent_stats["requests"] == 7
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "platforms", "config_entry"),
+    [
+        (
+            {"conversation": [FakeAgent(TEST_AGENT), FakeAgent(OTHER_AGENT)]},
+            [Platform.CONVERSATION, Platform.SENSOR],
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={
+                    "agent_id": TEST_AGENT,
+                    "agent_pool": [OTHER_AGENT],
+                    "load_balancing": "round_robin",
+                    "custom_summaries": [
+                        {"name": name, "prompt": name, "refresh": "interval"}
+                        for name in ("First", "Second", "Third")
+                    ],
+                },
+            ),
+        )
+    ],
+)
+async def test_parallel_refreshes(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Test scheduled summaries are refreshed in parallel by the agents in the pool."""
+    in_flight = 0
+    max_in_flight = 0
+
+    def slow(agent: FakeAgent) -> Any:
+        process = agent.async_process
+
+        async def async_process_slowly(user_input: Any) -> Any:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Yield so the other scheduled summaries can start their requests
+            for _ in range(5):
+                await asyncio.sleep(0)
+            in_flight -= 1
+            return await process(user_input)
+
+        return patch.object(agent, "async_process", side_effect=async_process_slowly)
+
+    agent, other_agent = mock_entities["conversation"]
+    next = dt_util.utcnow() + datetime.timedelta(minutes=20)
+    with slow(agent), slow(other_agent), freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Each agent in the pool works on one summary at a time
+    assert max_in_flight == 2
+    assert len(agent.conversations) + len(other_agent.conversations) == 3
+
+
+def test_least_outstanding() -> None:
+    """Test selecting the agent with the fewest outstanding requests."""
+    pool = AgentPool(["a", "b"], LoadBalancingStrategy.LEAST_OUTSTANDING)
+    pool.async_request_started("a")
+    assert pool.async_select() == "b"
+    pool.async_request_started("b")
+    pool.async_request_started("b")
+    assert pool.async_select() == "a"
+    pool.async_request_finished("b", 1.0, success=True)
+    pool.async_request_finished("b", 1.0, success=True)
+    assert pool.async_select() == "b"
+
+
+def test_lowest_latency() -> None:
+    """Test selecting the agent with the lowest recent latency."""
+    pool = AgentPool(["a", "b"], LoadBalancingStrategy.LOWEST_LATENCY)
+    pool.async_request_started("a")
+    pool.async_request_finished("a", 2.0, success=True)
+    # Agents without a latency measurement are tried first
+    assert pool.async_select() == "b"
+    pool.async_request_started("b")
+    pool.async_request_finished("b", 5.0, success=True)
+    assert pool.async_select() == "a"
+
+
+def test_circuit_breaker_backoff(freezer: FrozenDateTimeFactory) -> None:
+    """Test the circuit opens, probes with backoff and closes on recovery."""
+    pool = AgentPool(["a"], LoadBalancingStrategy.ROUND_ROBIN)
+    for _ in range(3):
+        assert pool.async_select() == "a"
+        pool.async_request_started("a")
+        pool.async_request_finished("a", 1.0, success=False)
+
+    # The circuit is open so no requests are sent until the first probe
+    assert pool.async_select() is None
+    assert not pool.async_available()
+    (stats,) = pool.as_dict()["agents"]
+    assert stats["state"] == "open"
+    assert stats["trips"] == 1
+
+    freezer.tick(datetime.timedelta(seconds=75))
+    assert pool.async_select() == "a"
+    pool.async_request_started("a")
+    # Only a single probe is sent at a time
+    assert pool.async_select() is None
+    assert pool.as_dict()["agents"][0]["state"] == "half_open"
+
+    # A failed probe opens the circuit with a longer delay
+    pool.async_request_finished("a", 1.0, success=False)
+    (stats,) = pool.as_dict()["agents"]
+    assert stats["state"] == "open"
+    assert stats["trips"] == 2
+    freezer.tick(datetime.timedelta(seconds=75))
+    assert pool.async_select() is None
+    freezer.tick(datetime.timedelta(seconds=75))
+    assert pool.async_select() == "a"
+
+    # A successful probe closes the circuit
+    pool.async_request_started("a")
+    pool.async_request_finished("a", 1.0, success=True)
+    (stats,) = pool.as_dict()["agents"]
+    assert stats["state"] == "closed"
+    assert stats["trips"] == 0
+    assert stats["healthy"]
@@ -12,6 +12,8 @@ from homeassistant.helpers.entity import Entity
 
 from custom_components.summary_agent.const import DOMAIN
 
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 from .conftest import FakeAgent, TEST_AGENT
 
 
@@ -52,3 +54,117 @@ async def test_select_agent(
         "agent_id": conversation_entity.entity_id,
     }
     assert len(mock_setup.mock_calls) == 1
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [
+        ({"conversation": [FakeAgent(TEST_AGENT)]}),
+    ],
+)
+async def test_options_flow_quantization(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    setup_integration: None,
+) -> None:
+    """Test configuring the quantization policy in the options flow."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result.get("type") is FlowResultType.FORM
+    assert result.get("step_id") == "init"
+
+    for quantization in ({"temperature": 0}, {"W": "coarse"}, ["temperature"]):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {"quantization": quantization}
+        )
+        assert result.get("type") is FlowResultType.FORM
+        assert result.get("errors") == {"base": "invalid_quantization"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            "quantization": {"temperature": 0.5, "W": 100},
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result.get("type") is FlowResultType.CREATE_ENTRY
+    assert config_entry.options["quantization"] == {"temperature": 0.5, "W": 100}
+    assert config_entry.options["significance_threshold"] == 5.0
+    assert config_entry.options["max_age"] == 120
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [
+        ({"conversation": [FakeAgent(TEST_AGENT)]}),
+    ],
+)
+async def test_options_flow_significance_weights(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    setup_integration: None,
+) -> None:
+    """Test configuring the significance weights in the options flow."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result.get("type") is FlowResultType.FORM
+
+    for weights in (
+        {"domain": {"lock": -1}},
+        {"domain": {"lock": "high"}},
+        {"domain": 10},
+        {"entity": {"lock.front_door": 10}},
+    ):
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"], {"significance_weights": weights}
+        )
+        assert result.get("type") is FlowResultType.FORM
+        assert result.get("errors") == {"base": "invalid_significance_weights"}
+
+    weights = {
+        "domain": {"lock": 10, "sensor": 0},
+        "device_class": {"door": 8},
+        "transition": {"lock.unlocked": 12.5},
+    }
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"significance_weights": weights}
+    )
+    assert result.get("type") is FlowResultType.CREATE_ENTRY
+    assert config_entry.options["significance_weights"] == weights
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [
+        ({"conversation": [FakeAgent(TEST_AGENT)]}),
+    ],
+)
+async def test_options_flow_custom_summaries(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    setup_integration: None,
+) -> None:
+    """Test configuring custom summaries in the options flow."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result.get("type") is FlowResultType.FORM
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"custom_summaries": [{"name": "Front Door", "prompt": "{{ states("}]},
+    )
+    assert result.get("type") is FlowResultType.FORM
+    assert result.get("errors") == {"base": "invalid_custom_summaries"}
+
+    custom_summaries = [
+        {
+            "name": "Front Door",
+            "prompt": "The door is {{ states('lock.front_door') }}",
+            "refresh": "interval",
+        }
+    ]
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"custom_summaries": custom_summaries}
+    )
+    await hass.async_block_till_done()
+
+    assert result.get("type") is FlowResultType.CREATE_ENTRY
+    assert config_entry.options["custom_summaries"] == custom_summaries
@@ -1,17 +1,22 @@
 """Test summary conversation agent."""
 
+import asyncio
 import datetime
 import textwrap
 import pathlib
+from typing import Any
+from unittest.mock import patch
 
 from freezegun import freeze_time
 import pytest
 import yaml
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
+    entity_registry as er,
 )
 from homeassistant.helpers.entity import Entity
 from homeassistant.util import dt as dt_util
@@ -23,15 +28,20 @@ from homeassistant.components.weather import (
 from homeassistant.setup import async_setup_component
 
 from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
     async_fire_time_changed,
 )
 
+from custom_components.summary_agent.const import DOMAIN
+from custom_components.summary_agent.engine import DATA_ENGINE
+
 from .conftest import (
     TEST_DEVICE_ID,
     FakeAgent,
     TEST_AGENT,
     FakeHumiditySensor,
     FakeTempSensor,
+    StreamingAgent,
 )
 
 TEST_AREA = "Kitchen"
@@ -150,7 +160,7 @@ async def test_area_with_devices(
             """
         Area: Kitchen
         - Some Device Name
-          - sensor Temperature: 20.0 °C
+          - sensor Temperature: 20 °C
           - sensor Humidity: 45 %
         Summary:"""
         )
@@ -158,6 +168,57 @@ async def test_area_with_devices(
     )
 
 
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+                "sensor": [
+                    FakeTempSensor(),
+                    FakeHumiditySensor(),
+                ],
+            },
+            ["Kitchen"],
+        ),
+    ],
+)
+async def test_area_quantized_states(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    device_registry: dr.DeviceRegistry,
+    area_entries: dict[str, ar.AreaEntry],
+) -> None:
+    """Tests that small sensor jitter does not change the area prompt."""
+
+    for device_entry in device_registry.devices.values():
+        device_registry.async_update_device(
+            device_entry.id, area_id=area_entries["Kitchen"].id
+        )
+
+    fake_agent = mock_entities["conversation"][0]
+    for temperature, humidity in (("20.4", "46"), ("19.6", "43.5")):
+        state = hass.states.get("sensor.temperature")
+        assert state
+        hass.states.async_set("sensor.temperature", temperature, state.attributes)
+        state = hass.states.get("sensor.humidity")
+        assert state
+        hass.states.async_set("sensor.humidity", humidity, state.attributes)
+        await hass.services.async_call(
+            "conversation",
+            "process",
+            {"agent_id": "conversation.area_summary", "text": "Kitchen"},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert len(fake_agent.conversations) == 2
+    assert fake_agent.conversations[0] == fake_agent.conversations[1]
+    assert "  - sensor Temperature: 20 °C\n" in fake_agent.conversations[0]
+    assert "  - sensor Humidity: 45 %\n" in fake_agent.conversations[0]
+
+
 @pytest.mark.parametrize(
     ("mock_entities"),
     [
@@ -197,6 +258,118 @@ async def test_template_entity(
     assert "input template 2" == input_prompt
 
 
+async def async_process_area(hass: HomeAssistant, area: str) -> str | None:
+    """Call the area summary agent and return the speech response."""
+    response = await hass.services.async_call(
+        "conversation",
+        "process",
+        {"agent_id": "conversation.area_summary", "text": area},
+        blocking=True,
+        return_response=True,
+    )
+    assert response
+    return response.get("response", {}).get("speech", {}).get("plain", {}).get("speech")
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        ({"conversation": [FakeAgent(TEST_AGENT)]}, ["Kitchen"]),
+    ],
+)
+async def test_local_summary_fallback(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    area_entries: dict[str, ar.AreaEntry],
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Tests that the area is summarized locally when the agent fails."""
+    lock_entry = entity_registry.async_get_or_create(
+        "lock", "test", "back-door", original_name="Back Door"
+    )
+    entity_registry.async_update_entity(
+        lock_entry.entity_id, area_id=area_entries["Kitchen"].id
+    )
+    hass.states.async_set(
+        lock_entry.entity_id, "unlocked", {"friendly_name": "Back Door"}
+    )
+
+    fake_agent = mock_entities["conversation"][0]
+    with patch.object(
+        fake_agent, "async_process", side_effect=HomeAssistantError("Server error")
+    ):
+        speech_response = await async_process_area(hass, "Kitchen")
+    assert speech_response == "Back Door is unlocked."
+
+    # A jammed lock is not reported as unlocked
+    hass.states.async_set(
+        lock_entry.entity_id, "jammed", {"friendly_name": "Back Door"}
+    )
+    with patch.object(
+        fake_agent, "async_process", side_effect=HomeAssistantError("Server error")
+    ):
+        speech_response = await async_process_area(hass, "Kitchen")
+    assert speech_response == "Back Door is jammed."
+
+    # The local summary is only built when the agent fails
+    fake_agent.responses.append(FAKE_AREA_SUMMARY)
+    with patch(
+        "custom_components.summary_agent.conversation.async_summarize_area"
+    ) as mock_summarize:
+        speech_response = await async_process_area(hass, "Kitchen")
+    assert speech_response == FAKE_AREA_SUMMARY
+    mock_summarize.assert_not_called()
+
+    # Areas that do not exist are not summarized locally
+    with patch.object(
+        fake_agent, "async_process", side_effect=HomeAssistantError("Server error")
+    ):
+        speech_response = await async_process_area(hass, "Garage")
+    assert speech_response == "Server error"
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas", "config_entry"),
+    [
+        (
+            {"conversation": [FakeAgent(TEST_AGENT)]},
+            ["Kitchen"],
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={"agent_id": TEST_AGENT, "local_fast_path": True},
+            ),
+        ),
+    ],
+)
+async def test_local_summary_fast_path(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    area_entries: dict[str, ar.AreaEntry],
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Tests that quiet areas are summarized without calling the agent."""
+    fake_agent = mock_entities["conversation"][0]
+    fake_agent.responses.append(FAKE_AREA_SUMMARY)
+
+    assert await async_process_area(hass, "Kitchen") == "The Kitchen is quiet."
+    assert not fake_agent.conversations
+
+    light_entry = entity_registry.async_get_or_create("light", "test", "ceiling")
+    entity_registry.async_update_entity(
+        light_entry.entity_id, area_id=area_entries["Kitchen"].id
+    )
+    hass.states.async_set(light_entry.entity_id, "off")
+    assert await async_process_area(hass, "Kitchen") == "The Kitchen is dark and quiet."
+    assert not fake_agent.conversations
+
+    # Areas with something happening are still summarized by the agent
+    hass.states.async_set(light_entry.entity_id, "on")
+    assert await async_process_area(hass, "Kitchen") == FAKE_AREA_SUMMARY
+    assert len(fake_agent.conversations) == 1
+
+
 class FakeWeather(WeatherEntity):
     """Fake agent."""
 
@@ -269,3 +442,245 @@ async def test_weather_template(
         "friendly_name": "Weather Summary",
         "summary": "It's cold.",
     }
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+                "sensor": [
+                    FakeTempSensor(),
+                    FakeHumiditySensor(),
+                ],
+            },
+            ["Kitchen"],
+        ),
+    ],
+)
+async def test_device_fragment_cache(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    device_registry: dr.DeviceRegistry,
+    area_entries: dict[str, ar.AreaEntry],
+) -> None:
+    """Tests that device fragments are reused until the device changes."""
+
+    device_entry = device_registry.async_get_device(identifiers={TEST_DEVICE_ID})
+    assert device_entry
+    device_registry.async_update_device(
+        device_entry.id, area_id=area_entries["Kitchen"].id
+    )
+    engine = hass.data[DATA_ENGINE]
+    fake_agent = mock_entities["conversation"][0]
+
+    await async_process_area(hass, "Kitchen")
+    await async_process_area(hass, "Kitchen")
+    assert fake_agent.conversations[0] == fake_agent.conversations[1]
+    assert engine.prompts.as_dict() == {"size": 1, "hits": 1, "misses": 1}
+    assert engine.fragments.as_dict() == {"size": 1, "hits": 0, "misses": 1}
+
+    # A state change of an entity of the device renders the device again
+    state = hass.states.get("sensor.humidity")
+    assert state
+    hass.states.async_set("sensor.humidity", "60", state.attributes)
+    await async_process_area(hass, "Kitchen")
+    assert "  - sensor Humidity: 60 %\n" in fake_agent.conversations[2]
+    assert engine.prompts.as_dict() == {"size": 1, "hits": 1, "misses": 2}
+    assert engine.fragments.as_dict() == {"size": 1, "hits": 0, "misses": 2}
+
+    # Renaming the device renders the device again
+    device_registry.async_update_device(device_entry.id, name_by_user="Thermostat")
+    await hass.async_block_till_done()
+    await async_process_area(hass, "Kitchen")
+    assert "- Thermostat\n" in fake_agent.conversations[3]
+    assert engine.prompts.as_dict() == {"size": 1, "hits": 1, "misses": 3}
+    assert engine.fragments.as_dict() == {"size": 1, "hits": 0, "misses": 3}
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [
+                    FakeAgent(TEST_AGENT),
+                    FakeAgent("conversation.other_agent"),
+                ],
+                "sensor": [
+                    FakeTempSensor(),
+                    FakeHumiditySensor(),
+                ],
+            },
+            ["Kitchen"],
+        ),
+    ],
+)
+async def test_shared_engine(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    area_entries: dict[str, ar.AreaEntry],
+) -> None:
+    """Tests that config entries share the rendered prompts of an area."""
+    other_entry = MockConfigEntry(
+        domain=DOMAIN, options={"agent_id": "conversation.other_agent"}
+    )
+    other_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(other_entry.entry_id)
+    await hass.async_block_till_done()
+
+    device_entry = device_registry.async_get_device(identifiers={TEST_DEVICE_ID})
+    assert device_entry
+    device_registry.async_update_device(
+        device_entry.id, area_id=area_entries["Kitchen"].id
+    )
+    await hass.async_block_till_done()
+
+    # Each entry has its own agents with unique ids scoped to the entry
+    agent_ids = []
+    for entry in (config_entry, other_entry):
+        agent_id = entity_registry.async_get_entity_id(
+            "conversation", DOMAIN, f"{entry.entry_id}-area-summary"
+        )
+        assert agent_id
+        agent_ids.append(agent_id)
+    assert agent_ids[0] != agent_ids[1]
+
+    engine = hass.data[DATA_ENGINE]
+    engine.prompts.async_clear()
+    for agent_id in agent_ids:
+        response = await hass.services.async_call(
+            "conversation",
+            "process",
+            {"agent_id": agent_id, "text": "Kitchen"},
+            blocking=True,
+            return_response=True,
+        )
+        assert response
+    fake_agent, other_agent = mock_entities["conversation"]
+    assert fake_agent.conversations[-1] == other_agent.conversations[-1]
+    assert "  - sensor Humidity: 45 %\n" in other_agent.conversations[-1]
+    assert engine.prompts.as_dict()["hits"] >= 1
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [
+        ({"conversation": [FakeAgent(TEST_AGENT)]}),
+    ],
+)
+async def test_migrate_unique_ids(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    entity_registry: er.EntityRegistry,
+    setup_integration: None,
+) -> None:
+    """Tests that unique ids of an existing entry are scoped to the entry."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, options={"agent_id": TEST_AGENT}, version=1, minor_version=1
+    )
+    config_entry.add_to_hass(hass)
+    entity_registry.async_get_or_create(
+        "conversation",
+        DOMAIN,
+        "area-summary",
+        config_entry=config_entry,
+        suggested_object_id="area_summary_legacy",
+    )
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.minor_version == 2
+    entry = entity_registry.async_get("conversation.area_summary_legacy")
+    assert entry
+    assert entry.unique_id == f"{config_entry.entry_id}-area-summary"
+    assert hass.states.get("conversation.area_summary_legacy")
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {"conversation": [StreamingAgent(TEST_AGENT)]},
+            ["Kitchen"],
+        ),
+    ],
+)
+async def test_streamed_response_budget(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Tests that a streamed response is ended once it exceeds the length budget."""
+    streaming_agent = mock_entities["conversation"][0]
+
+    streaming_agent.responses.append("The kitchen is quiet. The lights are off.")
+    assert (
+        await async_process_area(hass, "Kitchen")
+        == "The kitchen is quiet. The lights are off."
+    )
+    assert streaming_agent.deltas == 8
+
+    # A chatty response is cut after the complete sentences that fit
+    sentence = "The kitchen is quiet and everything is exactly as it was before. "
+    streaming_agent.deltas = 0
+    streaming_agent.responses.append(sentence * 20)
+    speech = await async_process_area(hass, "Kitchen")
+    assert speech == (sentence * 3).strip()
+    assert len(speech) <= 255
+    assert streaming_agent.deltas < 60
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [
+        ({"conversation": [FakeAgent(TEST_AGENT)]}),
+    ],
+)
+async def test_template_agent_timeout(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Tests that agents without a fallback wait on slow agents and report errors."""
+    fake_agent = mock_entities["conversation"][0]
+    process = fake_agent.async_process
+
+    async def async_process_slowly(user_input: Any) -> Any:
+        await asyncio.sleep(0.05)
+        return await process(user_input)
+
+    async def async_process_template() -> dict[str, Any]:
+        response = await hass.services.async_call(
+            "conversation",
+            "process",
+            {"agent_id": "conversation.template", "text": "Hello"},
+            blocking=True,
+            return_response=True,
+        )
+        assert response
+        return response["response"]
+
+    fake_agent.responses.append("Hi")
+    with (
+        patch(
+            "custom_components.summary_agent.conversation.AGENT_TIMEOUT",
+            datetime.timedelta(seconds=0.01),
+        ),
+        patch.object(fake_agent, "async_process", side_effect=async_process_slowly),
+    ):
+        response = await async_process_template()
+    assert response["speech"]["plain"]["speech"] == "Hi"
+
+    # A timeout from the backing agent is reported as an error response
+    with patch.object(fake_agent, "async_process", side_effect=TimeoutError):
+        response = await async_process_template()
+    assert response["response_type"] == "error"
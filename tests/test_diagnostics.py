@@ -0,0 +1,95 @@
+"""Tests for prompt captures, diagnostics and replay."""
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.summary_agent.const import DOMAIN
+from custom_components.summary_agent.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+from .conftest import FakeAgent, TEST_AGENT
+
+STAND_IN_AGENT = "conversation.stand_in"
+
+
+@pytest.fixture(name="config_entry")
+def mock_config_entry() -> MockConfigEntry:
+    """Fixture for a config entry with prompt captures enabled."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        options={"agent_id": TEST_AGENT, "capture_size": 2},
+    )
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [
+        (
+            {
+                "conversation": [
+                    FakeAgent(TEST_AGENT),
+                    FakeAgent(STAND_IN_AGENT),
+                ]
+            }
+        ),
+    ],
+)
+async def test_capture_and_replay(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Test capturing prompts in diagnostics and replaying them."""
+    fake_agent, stand_in_agent = mock_entities["conversation"]
+    fake_agent.responses.extend(["Summary 3", "Summary 2", "Summary 1"])
+
+    for text in ("Kitchen", "Bedroom", "Garage"):
+        await hass.services.async_call(
+            "conversation",
+            "process",
+            {"agent_id": "conversation.area_summary", "text": text},
+            blocking=True,
+            return_response=True,
+        )
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert diagnostics["agents"]["conversation.template"] == {"captures": []}
+    captures = diagnostics["agents"]["conversation.area_summary"]["captures"]
+    # The oldest capture was evicted from the buffer
+    assert [capture["input_text"] for capture in captures] == ["Bedroom", "Garage"]
+    assert [capture["response"] for capture in captures] == ["Summary 2", "Summary 3"]
+    assert captures[0]["entity_id"] == "conversation.area_summary"
+    assert captures[0]["agent_id"] == TEST_AGENT
+    assert "Area: Bedroom" in captures[0]["prompt"]
+    assert captures[0]["error"] is None
+
+    stand_in_agent.responses.extend(["Replayed 2", "Replayed 1"])
+    response = await hass.services.async_call(
+        DOMAIN,
+        "replay",
+        {"agent_id": STAND_IN_AGENT, "captures": captures},
+        blocking=True,
+        return_response=True,
+    )
+    assert response
+    assert response["count"] == 2
+    assert [result["response"] for result in response["results"]] == [
+        "Replayed 1",
+        "Replayed 2",
+    ]
+    assert [result["captured_response"] for result in response["results"]] == [
+        "Summary 2",
+        "Summary 3",
+    ]
+    assert not any(result["prompt_changed"] for result in response["results"])
+    assert stand_in_agent.conversations == [capture["prompt"] for capture in captures]
+
+    # Replayed prompts are not captured again
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert diagnostics["agents"]["conversation.area_summary"]["captures"] == captures
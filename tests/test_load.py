@@ -0,0 +1,203 @@
+"""Load tests for the summary pipeline against a simulated slow and flaky agent."""
+
+import asyncio
+from dataclasses import dataclass, field
+import datetime
+import logging
+import random
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import slugify
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.summary_agent.const import DOMAIN
+
+from .conftest import SimulatedAgent, TEST_AGENT
+
+_LOGGER = logging.getLogger(__name__)
+
+NUM_AREAS = 20
+ROUNDS = 3
+REQUESTS_PER_ROUND = 10
+AREAS = [f"Area {i}" for i in range(NUM_AREAS)]
+AGENT_TIMEOUT = datetime.timedelta(seconds=0.2)
+
+
+@dataclass
+class LoadReport:
+    """Results of a load test run."""
+
+    duration: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    """Latency of each request to the Area Summary agent."""
+    update_latencies: list[float] = field(default_factory=list)
+    """Latency of each update of an area summary sensor."""
+    max_queue_depth: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    staleness: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of requests completed per second."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    @staticmethod
+    def percentile(latencies: list[float], percentile: int) -> float:
+        """Return the latency percentile in seconds."""
+        if len(latencies) < 2:
+            return latencies[0] if latencies else 0.0
+        return statistics.quantiles(latencies, n=100)[percentile - 1]
+
+    def _latency_line(self, name: str, latencies: list[float]) -> str:
+        """Return the latency percentiles of a kind of request."""
+        return (
+            f"{name} latency p50={self.percentile(latencies, 50):.3f}s "
+            f"p95={self.percentile(latencies, 95):.3f}s "
+            f"p99={self.percentile(latencies, 99):.3f}s"
+        )
+
+    def __str__(self) -> str:
+        """Return a human readable report."""
+        lines = [
+            f"requests: {len(self.latencies)} in {self.duration:.3f}s "
+            f"({self.throughput:.1f}/s)",
+            self._latency_line("request", self.latencies),
+            f"sensor updates: {len(self.update_latencies)}",
+            self._latency_line("update", self.update_latencies),
+            f"max queue depth: {self.max_queue_depth}",
+            f"agent errors: {self.errors} timeouts: {self.timeouts}",
+            "staleness:",
+        ]
+        lines.extend(
+            f"  {area}: {staleness:.3f}s" for area, staleness in self.staleness.items()
+        )
+        return "\n".join(lines)
+
+
+async def async_run_load(
+    hass: HomeAssistant, agent: SimulatedAgent, rng: random.Random
+) -> LoadReport:
+    """Drive the area summary sensors and agent and collect a report."""
+    report = LoadReport()
+    sensor_ids = [f"sensor.{slugify(area)}_summary" for area in AREAS]
+
+    async def async_timed_process(area: str) -> None:
+        start = time.monotonic()
+        response = await hass.services.async_call(
+            "conversation",
+            "process",
+            {"agent_id": "conversation.area_summary", "text": area},
+            blocking=True,
+            return_response=True,
+        )
+        report.latencies.append(time.monotonic() - start)
+        assert response
+
+    async def async_timed_update(sensor_id: str) -> None:
+        start = time.monotonic()
+        await hass.services.async_call(
+            "homeassistant",
+            "update_entity",
+            {"entity_id": sensor_id},
+            blocking=True,
+        )
+        report.update_latencies.append(time.monotonic() - start)
+
+    start = time.monotonic()
+    for _ in range(ROUNDS):
+        await asyncio.gather(
+            *(async_timed_update(sensor_id) for sensor_id in sensor_ids),
+            *(
+                async_timed_process(rng.choice(AREAS))
+                for _ in range(REQUESTS_PER_ROUND)
+            ),
+        )
+    report.duration = time.monotonic() - start
+
+    now = datetime.datetime.now(datetime.UTC)
+    for area, sensor_id in zip(AREAS, sensor_ids):
+        state = hass.states.get(sensor_id)
+        assert state
+        report.staleness[area] = (now - state.last_updated).total_seconds()
+    report.max_queue_depth = agent.max_queue_depth
+    report.errors = agent.errors
+    report.timeouts = agent.timeouts
+    return report
+
+
+@pytest.fixture(name="platforms")
+def mock_platforms() -> list[Platform]:
+    """Fixture for platforms loaded by the integration."""
+    return [Platform.CONVERSATION, Platform.SENSOR]
+
+
+@pytest.fixture(name="config_entry")
+def mock_config_entry() -> MockConfigEntry:
+    """Fixture for a config entry that summarizes on every update."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        options={"agent_id": TEST_AGENT, "significance_threshold": 0},
+    )
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [
+                    SimulatedAgent(TEST_AGENT, latency=0.005, max_concurrency=4)
+                ]
+            },
+            AREAS,
+        ),
+        (
+            {
+                "conversation": [
+                    SimulatedAgent(
+                        TEST_AGENT,
+                        latency=0.02,
+                        jitter=1.0,
+                        error_rate=0.2,
+                        timeout_rate=0.05,
+                        max_concurrency=2,
+                    )
+                ]
+            },
+            AREAS,
+        ),
+    ],
+    ids=["fast", "slow_flaky"],
+)
+async def test_load(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Run the summary pipeline under load and report latency and staleness."""
+    agent = mock_entities["conversation"][0]
+
+    with patch(
+        "custom_components.summary_agent.conversation.AGENT_TIMEOUT", AGENT_TIMEOUT
+    ):
+        report = await async_run_load(hass, agent, random.Random(0))
+
+    _LOGGER.info("Load test report:\n%s", report)
+
+    assert len(report.latencies) == ROUNDS * REQUESTS_PER_ROUND
+    assert len(report.update_latencies) == ROUNDS * NUM_AREAS
+    assert report.max_queue_depth > 0
+    # Every area has a summary, even when the agent failed or timed out
+    for sensor_id in (f"sensor.{slugify(area)}_summary" for area in AREAS):
+        state = hass.states.get(sensor_id)
+        assert state
+        assert state.state not in ("unknown", "unavailable")
@@ -2,24 +2,39 @@
 
 import datetime
 import pathlib
+from typing import Any
+from unittest.mock import patch
 
 from freezegun import freeze_time
 import pytest
 
-from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, State
+from homeassistant.const import EVENT_STATE_CHANGED, Platform
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
+    entity_registry as er,
 )
 from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
 
 from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
     async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.summary_agent.const import DOMAIN, EVENT_SUMMARY_UPDATED
+from custom_components.summary_agent.diagnostics import (
+    async_get_config_entry_diagnostics,
 )
 
 from .conftest import (
     FakeAgent,
+    FakeHumiditySensor,
     TEST_AGENT,
 )
 
@@ -103,3 +118,712 @@ async def test_long_summary_truncation(
     state = hass.states.get("sensor.kitchen_summary")
     assert state
     assert state.state == "A " * 125 + "A..."
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+                "sensor": [FakeHumiditySensor()],
+            },
+            ["Kitchen"],
+        ),
+    ],
+)
+async def test_significance_gate(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    area_entries: dict[str, ar.AreaEntry],
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Tests that the summary is only regenerated for significant changes."""
+
+    area_id = area_entries["Kitchen"].id
+    for device_entry in device_registry.devices.values():
+        device_registry.async_update_device(device_entry.id, area_id=area_id)
+    lock_entry = entity_registry.async_get_or_create("lock", "test", "front-door")
+    entity_registry.async_update_entity(lock_entry.entity_id, area_id=area_id)
+    hass.states.async_set(lock_entry.entity_id, "locked")
+
+    fake_agent = mock_entities["conversation"][0]
+    fake_agent.responses.append(FAKE_AREA_SUMMARY)
+
+    now = datetime.datetime.now()
+    next = now + datetime.timedelta(minutes=20)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 1
+
+    # A small change in humidity is not significant enough for a new summary
+    state = hass.states.get("sensor.humidity")
+    assert state
+    hass.states.async_set("sensor.humidity", "47", state.attributes)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    next = now + datetime.timedelta(minutes=40)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 1
+
+    # The state is not written while the summary is unchanged
+    assert not [
+        event
+        for event in events
+        if event.data["entity_id"] == "sensor.kitchen_summary"
+    ]
+
+    # The accumulated significance is visible in diagnostics for tuning
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    tuning = diagnostics["sensors"]["sensor.kitchen_summary"]
+    assert tuning["area_id"] == area_id
+    assert 0 < tuning["significance"] < 1
+    assert tuning["significance_reason"].startswith("sensor.humidity 47")
+    assert 0 < tuning["similarity"] <= 1
+    assert len(fake_agent.conversations) == 1
+
+    # Unlocking the door is significant
+    hass.states.async_set(lock_entry.entity_id, "unlocked")
+    fake_agent.responses.append("The front door is unlocked")
+    next = now + datetime.timedelta(minutes=60)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 2
+
+    state = hass.states.get("sensor.kitchen_summary")
+    assert state
+    assert state.state == "The front door is unlocked"
+    assert state.attributes["significance"] == 0
+    assert state.attributes["significance_reason"] is None
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+            },
+            ["Kitchen", "Bedroom"],
+        ),
+    ],
+)
+async def test_summary_subscription(
+    hass: HomeAssistant,
+    area_entries: dict[str, ar.AreaEntry],
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Tests that new summaries are published as events and to subscribers."""
+
+    events = async_capture_events(hass, EVENT_SUMMARY_UPDATED)
+    kitchen_id = area_entries["Kitchen"].id
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "summary_agent/subscribe", "area_id": kitchen_id}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    fake_agent = mock_entities["conversation"][0]
+    fake_agent.responses.extend(["The bedroom is dark", FAKE_AREA_SUMMARY])
+
+    now = datetime.datetime.now()
+    next = now + datetime.timedelta(minutes=20)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+
+    assert sorted(event.data["area_name"] for event in events) == [
+        "Bedroom",
+        "Kitchen",
+    ]
+
+    # Only the subscribed area is sent
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    assert msg["event"]["entity_id"] == "sensor.kitchen_summary"
+    assert msg["event"]["area_id"] == kitchen_id
+    assert msg["event"]["summary"] == FAKE_AREA_SUMMARY
+
+    # A new subscriber receives the current summaries
+    other_client = await hass_ws_client(hass)
+    await other_client.send_json_auto_id({"type": "summary_agent/subscribe"})
+    msg = await other_client.receive_json()
+    assert msg["success"]
+    summaries = set()
+    for _ in range(2):
+        msg = await other_client.receive_json()
+        assert msg["type"] == "event"
+        summaries.add(msg["event"]["summary"])
+    assert summaries == {FAKE_AREA_SUMMARY, "The bedroom is dark"}
+
+    # A regenerated summary with the same text is not published again
+    fake_agent.responses.extend(["The bedroom is dark", FAKE_AREA_SUMMARY])
+    next = now + datetime.timedelta(hours=3)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 4
+    assert len(events) == 2
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+            },
+            ["Kitchen"],
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    ("config_entry"),
+    [
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={"agent_id": TEST_AGENT, "significance_threshold": 0},
+        )
+    ],
+)
+async def test_stale_summary_when_circuit_open(
+    hass: HomeAssistant,
+    area_entries: dict[str, ar.AreaEntry],
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Tests the last summary is kept while the backing agent is failing."""
+
+    fake_agent = mock_entities["conversation"][0]
+    fake_agent.responses.append(FAKE_AREA_SUMMARY)
+
+    async def async_update() -> None:
+        await hass.services.async_call(
+            "homeassistant",
+            "update_entity",
+            {"entity_id": "sensor.kitchen_summary"},
+            blocking=True,
+        )
+
+    await async_update()
+    state = hass.states.get("sensor.kitchen_summary")
+    assert state
+    assert state.state == FAKE_AREA_SUMMARY
+    assert not state.attributes["stale"]
+
+    with patch.object(
+        fake_agent, "async_process", side_effect=HomeAssistantError("Server error")
+    ) as mock_process:
+        # Failing requests open the circuit for the backing agent
+        for _ in range(3):
+            await hass.services.async_call(
+                "conversation",
+                "process",
+                {"agent_id": "conversation.area_summary", "text": "Bedroom"},
+                blocking=True,
+                return_response=True,
+            )
+        assert len(mock_process.mock_calls) == 3
+
+        await async_update()
+        assert len(mock_process.mock_calls) == 3
+
+    state = hass.states.get("sensor.kitchen_summary")
+    assert state
+    assert state.state == FAKE_AREA_SUMMARY
+    assert state.attributes["stale"]
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+            },
+            ["Kitchen", "Bedroom"],
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    ("config_entry"),
+    [
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={
+                "agent_id": TEST_AGENT,
+                "significance_threshold": 0,
+                "lazy": True,
+            },
+        )
+    ],
+)
+async def test_lazy_summaries(
+    hass: HomeAssistant,
+    area_entries: dict[str, ar.AreaEntry],
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Tests that only areas in use are refreshed in lazy mode."""
+
+    fake_agent = mock_entities["conversation"][0]
+
+    def summarized_areas() -> list[str]:
+        areas = [
+            area
+            for prompt in fake_agent.conversations
+            for area in ("Kitchen", "Bedroom")
+            if f"Area: {area}\n" in prompt
+        ]
+        fake_agent.conversations.clear()
+        return sorted(areas)
+
+    now = datetime.datetime.now()
+
+    async def async_poll(delay: datetime.timedelta) -> None:
+        next = now + delay
+        with freeze_time(next):
+            async_fire_time_changed(hass, next)
+            await hass.async_block_till_done()
+
+    # Areas without a summary are always summarized
+    await async_poll(datetime.timedelta(minutes=20))
+    assert summarized_areas() == ["Bedroom", "Kitchen"]
+
+    # Nobody is using either area
+    await async_poll(datetime.timedelta(minutes=40))
+    assert summarized_areas() == []
+
+    # A subscriber is watching the kitchen
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "summary_agent/subscribe", "area_id": area_entries["Kitchen"].id}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    await async_poll(datetime.timedelta(minutes=60))
+    assert summarized_areas() == ["Kitchen"]
+    msg = await client.receive_json()
+    assert msg["event"]["area_id"] == area_entries["Kitchen"].id
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": msg["id"]}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    # The bedroom is requested from the agent and nobody watches the kitchen
+    with freeze_time(now + datetime.timedelta(minutes=70)):
+        await hass.services.async_call(
+            "conversation",
+            "process",
+            {"agent_id": "conversation.area_summary", "text": "Bedroom"},
+            blocking=True,
+            return_response=True,
+        )
+    assert summarized_areas() == ["Bedroom"]
+    await async_poll(datetime.timedelta(minutes=80))
+    assert summarized_areas() == ["Bedroom"]
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas", "config_entry"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+                "sensor": [FakeHumiditySensor()],
+            },
+            ["Kitchen"],
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={
+                    "agent_id": TEST_AGENT,
+                    "max_age": 30,
+                    "similarity_threshold": 0,
+                },
+            ),
+        )
+    ],
+)
+async def test_similar_summary_reuse(
+    hass: HomeAssistant,
+    area_entries: dict[str, ar.AreaEntry],
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Tests that a similar summary is reused unless a change is significant."""
+
+    area_id = area_entries["Kitchen"].id
+    for device_entry in device_registry.devices.values():
+        device_registry.async_update_device(device_entry.id, area_id=area_id)
+    lock_entry = entity_registry.async_get_or_create("lock", "test", "front-door")
+    entity_registry.async_update_entity(lock_entry.entity_id, area_id=area_id)
+    hass.states.async_set(lock_entry.entity_id, "locked")
+
+    fake_agent = mock_entities["conversation"][0]
+    fake_agent.responses.append(FAKE_AREA_SUMMARY)
+
+    now = datetime.datetime.now()
+
+    async def async_poll(delay: datetime.timedelta) -> None:
+        next = now + delay
+        with freeze_time(next):
+            async_fire_time_changed(hass, next)
+            await hass.async_block_till_done()
+
+    await async_poll(datetime.timedelta(minutes=20))
+    assert len(fake_agent.conversations) == 1
+    state = hass.states.get("sensor.kitchen_summary")
+    assert state
+    assert state.attributes["similarity"] is None
+
+    # A small change in humidity leaves the area similar once the summary is old
+    state = hass.states.get("sensor.humidity")
+    assert state
+    hass.states.async_set("sensor.humidity", "47", state.attributes)
+    await async_poll(datetime.timedelta(minutes=60))
+    assert len(fake_agent.conversations) == 1
+    state = hass.states.get("sensor.kitchen_summary")
+    assert state
+    assert state.state == FAKE_AREA_SUMMARY
+
+    # Unlocking the door is significant however similar the area stays
+    hass.states.async_set(lock_entry.entity_id, "unlocked")
+    fake_agent.responses.append("The front door is unlocked")
+    await async_poll(datetime.timedelta(minutes=80))
+    assert len(fake_agent.conversations) == 2
+
+    state = hass.states.get("sensor.kitchen_summary")
+    assert state
+    assert state.state == "The front door is unlocked"
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "areas", "config_entry"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+            },
+            ["Kitchen"],
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={
+                    "agent_id": TEST_AGENT,
+                    "significance_threshold": 0,
+                    "max_age": 0,
+                    "history_size": 2,
+                },
+            ),
+        )
+    ],
+)
+async def test_summary_history(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    hass_ws_client: WebSocketGenerator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Tests that recent summaries are kept in a bounded history."""
+
+    fake_agent = mock_entities["conversation"][0]
+    fake_agent.responses.extend(
+        ["The lights are off", "The lights are on", "The lights are on", "It is quiet"]
+    )
+
+    now = datetime.datetime.now()
+    for minutes in (20, 40, 60, 80):
+        next = now + datetime.timedelta(minutes=minutes)
+        with freeze_time(next):
+            async_fire_time_changed(hass, next)
+            await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 4
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "summary_agent/history", "entity_id": "sensor.kitchen_summary"}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert [entry["summary"] for entry in msg["result"]["history"]] == [
+        "The lights are on",
+        "The lights are off",
+    ]
+
+    # The history is only written to the store after a delay
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(minutes=2))
+    await hass.async_block_till_done()
+    stored = hass_storage[f"{DOMAIN}.{config_entry.entry_id}.history"]
+    assert len(stored["data"]["sensor.kitchen_summary"]) == 2
+
+    await client.send_json_auto_id(
+        {"type": "summary_agent/history", "entity_id": "sensor.humidity"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "config_entry"),
+    [
+        (
+            {
+                "conversation": [FakeAgent(TEST_AGENT)],
+                "sensor": [FakeHumiditySensor()],
+            },
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={
+                    "agent_id": TEST_AGENT,
+                    "custom_summaries": [
+                        {
+                            "name": "Front Door",
+                            "prompt": "The door is {{ states('lock.front_door') }}",
+                        },
+                        {
+                            "name": "Humidity Report",
+                            "prompt": "Humidity is {{ states('sensor.humidity') }}",
+                            "refresh": "interval",
+                            "interval": 30,
+                        },
+                    ],
+                },
+            ),
+        )
+    ],
+)
+async def test_custom_summaries(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Tests custom summaries refreshed on template changes and on an interval."""
+
+    fake_agent = mock_entities["conversation"][0]
+    await hass.async_block_till_done()
+
+    # Summaries following the template are summarized when set up
+    assert fake_agent.conversations == ["The door is unknown"]
+    fake_agent.conversations.clear()
+
+    # Changes within the rate limit are summarized together once it has passed
+    fake_agent.responses.append("The front door is unlocked")
+    hass.states.async_set("lock.front_door", "locked")
+    hass.states.async_set("lock.front_door", "unlocked")
+    await hass.async_block_till_done()
+    assert fake_agent.conversations == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(minutes=5))
+    await hass.async_block_till_done()
+    assert fake_agent.conversations == ["The door is unlocked"]
+    state = hass.states.get("sensor.front_door")
+    assert state
+    assert state.state == "The front door is unlocked"
+
+    # Interval summaries are refreshed with the area summaries
+    fake_agent.responses.append("It is humid")
+    now = datetime.datetime.now()
+    next = now + datetime.timedelta(minutes=20)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert fake_agent.conversations[-1] == "Humidity is 45"
+    state = hass.states.get("sensor.humidity_report")
+    assert state
+    assert state.state == "It is humid"
+
+    # The summary is not refreshed before the interval or for the same prompt
+    for minutes in (40, 70):
+        next = now + datetime.timedelta(minutes=minutes)
+        with freeze_time(next):
+            async_fire_time_changed(hass, next)
+            await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 2
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "config_entry"),
+    [
+        (
+            {"conversation": [FakeAgent(TEST_AGENT)]},
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={
+                    "agent_id": TEST_AGENT,
+                    "custom_summaries": [
+                        {"name": "First", "prompt": "First", "refresh": "interval"},
+                        {"name": "Second", "prompt": "Second", "refresh": "interval"},
+                    ],
+                },
+            ),
+        )
+    ],
+)
+async def test_scheduled_update_error_isolated(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Tests that an unexpected error updating one summary does not stop the others."""
+
+    fake_agent = mock_entities["conversation"][0]
+    process = fake_agent.async_process
+    calls = 0
+
+    async def async_process_once_failing(user_input: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("Unexpected")
+        return await process(user_input)
+
+    fake_agent.responses.append("The second summary")
+    next = datetime.datetime.now() + datetime.timedelta(minutes=20)
+    with (
+        patch.object(
+            fake_agent, "async_process", side_effect=async_process_once_failing
+        ),
+        freeze_time(next),
+    ):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.first")
+    assert state
+    assert state.attributes["stale"] is True
+    state = hass.states.get("sensor.second")
+    assert state
+    assert state.state == "The second summary"
+
+
+FRONT_DOOR_SUMMARY = {
+    "name": "Front Door",
+    "prompt": "The door is {{ states('lock.front_door') }}",
+}
+
+
+@pytest.fixture(name="restored_summary")
+def mock_restored_summary(hass: HomeAssistant) -> None:
+    """Fixture for a custom summary restored with the prompt it was made from."""
+    hass.states.async_set("lock.front_door", "locked")
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State("sensor.front_door", "The front door is locked"),
+                {
+                    "native_value": "The front door is locked",
+                    "native_unit_of_measurement": None,
+                    "prompt": "The door is locked",
+                },
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "config_entry"),
+    [
+        (
+            {"conversation": [FakeAgent(TEST_AGENT)]},
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={
+                    "agent_id": TEST_AGENT,
+                    "custom_summaries": [FRONT_DOOR_SUMMARY],
+                },
+            ),
+        )
+    ],
+)
+async def test_custom_summary_retry(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Tests a prompt that failed to be summarized is retried on the next update."""
+
+    fake_agent = mock_entities["conversation"][0]
+    await hass.async_block_till_done()
+    fake_agent.conversations.clear()
+
+    hass.states.async_set("lock.front_door", "unlocked")
+    now = datetime.datetime.now()
+    next = now + datetime.timedelta(minutes=5)
+    with (
+        patch.object(
+            fake_agent, "async_process", side_effect=HomeAssistantError("down")
+        ),
+        freeze_time(next),
+    ):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    state = hass.states.get("sensor.front_door")
+    assert state
+    assert state.attributes["stale"] is True
+
+    # The same prompt is summarized again when the summaries are updated
+    fake_agent.responses.append("The front door is unlocked")
+    next = now + datetime.timedelta(minutes=20)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert fake_agent.conversations == ["The door is unlocked"]
+    state = hass.states.get("sensor.front_door")
+    assert state
+    assert state.state == "The front door is unlocked"
+    assert state.attributes["stale"] is False
+
+
+@pytest.mark.parametrize(
+    ("mock_entities", "config_entry"),
+    [
+        (
+            {"conversation": [FakeAgent(TEST_AGENT)]},
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={
+                    "agent_id": TEST_AGENT,
+                    "custom_summaries": [FRONT_DOOR_SUMMARY],
+                },
+            ),
+        )
+    ],
+)
+async def test_custom_summary_restored(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    restored_summary: None,
+    setup_integration: None,
+) -> None:
+    """Tests a restored summary is kept until its prompt changes."""
+
+    fake_agent = mock_entities["conversation"][0]
+    await hass.async_block_till_done()
+    assert fake_agent.conversations == []
+    state = hass.states.get("sensor.front_door")
+    assert state
+    assert state.state == "The front door is locked"
+
+    fake_agent.responses.append("The front door is unlocked")
+    hass.states.async_set("lock.front_door", "unlocked")
+    await hass.async_block_till_done()
+    assert fake_agent.conversations == ["The door is unlocked"]
+    state = hass.states.get("sensor.front_door")
+    assert state
+    assert state.state == "The front door is unlocked"
@@ -0,0 +1,111 @@
+"""Tests for template summaries refreshed by their dependencies."""
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from pytest_homeassistant_custom_component.common import MockUser
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from .conftest import FakeAgent, TEST_AGENT
+
+TEMPLATE = "The temperature is {{ states('sensor.outside') }}"
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [{"conversation": [FakeAgent(TEST_AGENT)]}],
+)
+async def test_subscribe_template(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test a template is only summarized again when its prompt changes."""
+    fake_agent = mock_entities["conversation"][0]
+    fake_agent.responses.extend(["It is warm", "It is cold"])
+    hass.states.async_set("sensor.outside", "5")
+    hass.states.async_set("sensor.inside", "20")
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "summary_agent/subscribe_template", "template": TEMPLATE}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    msg = await client.receive_json()
+    assert msg["event"] == {"summary": "It is cold"}
+    assert fake_agent.conversations == ["The temperature is 5"]
+
+    # Entities the template does not read do not render it again
+    hass.states.async_set("sensor.inside", "21")
+    # Changes that do not affect the prompt do not call the agent
+    hass.states.async_set("sensor.outside", "5", {"friendly_name": "Outside"})
+    await hass.async_block_till_done()
+    assert fake_agent.conversations == ["The temperature is 5"]
+
+    hass.states.async_set("sensor.outside", "30")
+    msg = await client.receive_json()
+    assert msg["event"] == {"summary": "It is warm"}
+    assert fake_agent.conversations == [
+        "The temperature is 5",
+        "The temperature is 30",
+    ]
+
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": msg["id"]}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    hass.states.async_set("sensor.outside", "10")
+    await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 2
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [{"conversation": [FakeAgent(TEST_AGENT)]}],
+)
+async def test_subscribe_template_unknown_agent(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscribing with an agent that is not a template agent."""
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {
+            "type": "summary_agent/subscribe_template",
+            "template": TEMPLATE,
+            "agent_id": "conversation.area_summary",
+        }
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [{"conversation": [FakeAgent(TEST_AGENT)]}],
+)
+async def test_subscribe_template_requires_admin(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test only administrators can have templates summarized."""
+    hass_admin_user.groups = []
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "summary_agent/subscribe_template", "template": TEMPLATE}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "unauthorized"
+    assert mock_entities["conversation"][0].conversations == []
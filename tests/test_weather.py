@@ -0,0 +1,194 @@
+"""Tests for the weather forecast summary agent and sensor."""
+
+import datetime
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.weather import (
+    Forecast,
+    WeatherEntity,
+    WeatherEntityFeature,
+)
+from homeassistant.const import Platform, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.summary_agent.const import DOMAIN
+from custom_components.summary_agent.forecast import compress_forecast
+
+from .conftest import FakeAgent, TEST_AGENT
+
+WEATHER_ENTITY = "weather.home"
+START = datetime.datetime(2024, 4, 22, 9, 0, tzinfo=datetime.UTC)
+
+
+def make_forecast(
+    conditions: list[str],
+    temperatures: list[float],
+    probabilities: list[int],
+) -> list[Forecast]:
+    """Return an hourly forecast starting at a fixed time."""
+    return [
+        Forecast(
+            datetime=(START + datetime.timedelta(hours=i)).isoformat(),
+            condition=condition,
+            native_temperature=temperature,
+            precipitation_probability=probability,
+        )
+        for i, (condition, temperature, probability) in enumerate(
+            zip(conditions, temperatures, probabilities)
+        )
+    ]
+
+
+FORECAST = make_forecast(
+    ["sunny"] * 3 + ["rainy"] * 2 + ["cloudy"],
+    [12.2, 14.6, 17.1, 15.0, 13.4, 11.8],
+    [0, 10, 20, 60, 80, 10],
+)
+
+
+class FakeWeather(WeatherEntity):
+    """Fake weather entity with an hourly forecast."""
+
+    _attr_name = "Home"
+    _attr_unique_id = "weather-home"
+    _attr_condition = "sunny"
+    _attr_native_temperature = 12.2
+    _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_supported_features = WeatherEntityFeature.FORECAST_HOURLY
+
+    def __init__(self) -> None:
+        """Initialize FakeWeather."""
+        self.forecast = FORECAST
+        self.forecast_requests = 0
+
+    async def async_forecast_hourly(self) -> list[Forecast] | None:
+        """Return the hourly forecast."""
+        self.forecast_requests += 1
+        return self.forecast
+
+
+def test_compress_forecast(hass: HomeAssistant) -> None:
+    """Test compressing an hourly forecast to parts of the day."""
+    forecast = [
+        {
+            "datetime": item["datetime"],
+            "condition": item["condition"],
+            "temperature": item["native_temperature"],
+            "precipitation_probability": item["precipitation_probability"],
+        }
+        for item in FORECAST
+    ]
+    assert compress_forecast(forecast, "°C") == "\n".join(
+        [
+            "- early this morning: sunny then rainy, 12 to 17 °C, "
+            "up to 60% chance of precipitation",
+            "- this morning: rainy then cloudy, 12 to 13 °C, "
+            "up to 80% chance of precipitation",
+        ]
+    )
+    # The text does not change as the forecast advances by an hour
+    assert compress_forecast(forecast[1:], "°C") == compress_forecast(
+        forecast[2:], "°C"
+    )
+    assert compress_forecast([]) == "No forecast available"
+
+
+@pytest.mark.parametrize(
+    ("mock_entities"),
+    [
+        {
+            "conversation": [FakeAgent(TEST_AGENT)],
+            "weather": [FakeWeather()],
+        }
+    ],
+)
+@pytest.mark.parametrize(
+    ("config_entry", "platforms"),
+    [
+        (
+            MockConfigEntry(
+                domain=DOMAIN,
+                options={"agent_id": TEST_AGENT, "weather_entity": WEATHER_ENTITY},
+            ),
+            [Platform.CONVERSATION, Platform.SENSOR],
+        )
+    ],
+)
+async def test_weather_summary_sensor(
+    hass: HomeAssistant,
+    mock_entities: dict[str, Entity],
+    setup_integration: None,
+) -> None:
+    """Test the weather summary is only regenerated when the forecast changes."""
+    fake_agent = mock_entities["conversation"][0]
+    weather = mock_entities["weather"][0]
+    fake_agent.responses.append("Rain this afternoon.")
+
+    now = dt_util.utcnow()
+    next = now + datetime.timedelta(minutes=20)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.weather_summary")
+    assert state
+    assert state.state == "Rain this afternoon."
+    assert len(fake_agent.conversations) == 1
+    assert "- early this morning: sunny then rainy" in fake_agent.conversations[0]
+    assert "datetime" not in fake_agent.conversations[0]
+    # The agent summarizes the forecast the sensor fetched
+    assert weather.forecast_requests == 1
+
+    # Small revisions to the forecast do not change the compressed forecast
+    weather.forecast = make_forecast(
+        ["sunny"] * 3 + ["rainy"] * 2 + ["cloudy"],
+        [12.4, 14.5, 17.2, 15.1, 13.3, 11.9],
+        [0, 10, 20, 61, 78, 10],
+    )
+    next = now + datetime.timedelta(minutes=40)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 1
+
+    # The rain clears so the forecast is summarized again
+    weather.forecast = make_forecast(
+        ["sunny"] * 6, [12.2, 14.6, 17.1, 15.0, 13.4, 11.8], [0] * 6
+    )
+    fake_agent.responses.append("Sunny all day.")
+    next = now + datetime.timedelta(minutes=60)
+    with freeze_time(next):
+        async_fire_time_changed(hass, next)
+        await hass.async_block_till_done()
+    assert len(fake_agent.conversations) == 2
+    assert "Precipitation: none expected" in fake_agent.conversations[1]
+
+    state = hass.states.get("sensor.weather_summary")
+    assert state
+    assert state.state == "Sunny all day."
+
+    # A failed summary keeps the last summary and marks it stale
+    weather.forecast = FORECAST
+    with patch.object(
+        fake_agent, "async_process", side_effect=HomeAssistantError("down")
+    ):
+        next = now + datetime.timedelta(minutes=80)
+        with freeze_time(next):
+            async_fire_time_changed(hass, next)
+            await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.weather_summary")
+    assert state
+    assert state.state == "Sunny all day."
+    assert state.attributes["stale"] is True